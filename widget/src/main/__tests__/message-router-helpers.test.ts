@@ -1,4 +1,4 @@
-import { looksLikeToolJson } from '../tool-helpers';
+import { looksLikeToolJson, extractToolJson } from '../tool-helpers';
 
 describe('message-router helper', () => {
   test('detects tool-like JSON content', () => {
@@ -11,6 +11,17 @@ describe('message-router helper', () => {
     expect(looksLikeToolJson('Just a number: 12345')).toBe(false);
   });
 
+  test('extracts a tool object despite trailing tokens', () => {
+    const content = '{"name":"nba_query","parameters":{"type":"games"}} let me run that';
+    expect(extractToolJson(content)).toEqual({ name: 'nba_query', parameters: { type: 'games' } });
+  });
+
+  test('treats braces inside string literals as data, not structure', () => {
+    const content = '{"name":"write_file","arguments":{"content":"if (x) { y(); }"}}';
+    expect(extractToolJson(content)?.name).toBe('write_file');
+    expect(extractToolJson('no tool call here')).toBeNull();
+  });
+
   test('preProcessIntent detects NBA queries', async () => {
     const { preProcessIntent } = require('../message-router');
     const r = await preProcessIntent('Give me a report of this weeks NBA games');
@@ -35,4 +35,30 @@ describe('executeToolBatch', () => {
     expect((res[0] as any).status).toBe('needs_confirmation');
     expect((res[0] as any).missingPermissions).toContain('write_file');
   });
+
+  test('runs independent calls concurrently and preserves result order', async () => {
+    const { registerTool, executeToolBatch } = require('../tools');
+    const started: string[] = [];
+    registerTool('dummy_slow', { name: 'dummy_slow', description: 'dummy', parameters: { type: 'object', properties: {}, required: [] } } as any, async () => {
+      started.push('slow');
+      await new Promise(r => setTimeout(r, 20));
+      return { success: true, result: 'slow' };
+    });
+    registerTool('dummy_fast', { name: 'dummy_fast', description: 'dummy', parameters: { type: 'object', properties: {}, required: [] } } as any, async () => {
+      started.push('fast');
+      return { success: true, result: 'fast' };
+    });
+
+    jest.spyOn(config, 'assertPermission').mockReturnValue(true);
+
+    const res = await executeToolBatch([
+      { name: 'dummy_slow', arguments: {} },
+      { name: 'dummy_fast', arguments: {} }
+    ] as any, { executionId: 'test' } as any);
+
+    // Both handlers start before the slow one resolves, and results come
+    // back in call order regardless of completion order.
+    expect(started).toEqual(['slow', 'fast']);
+    expect(res.map((r: any) => r.result)).toEqual(['slow', 'fast']);
+  });
 });
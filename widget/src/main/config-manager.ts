@@ -2,7 +2,7 @@ import { app } from 'electron';
 import { join } from 'path';
 import { readFileSync, writeFileSync, existsSync, mkdirSync } from 'fs';
 import { logTelemetryConsent } from './utils/logger';
-import { isReleaseBuild } from './env';
+import { isReleaseBuild, isDemoMode } from './env';
 
 interface WindowPosition {
   x: number;
@@ -73,9 +73,11 @@ const DEFAULT_SETTINGS: Settings = {
   defaultTeam: 'GSW'
 };
 
-// A convenience function for asserting permissions on a tool
-export function assertPermission(toolName: string): boolean {
-  const settings = getSettings();
+// A convenience function for asserting permissions on a tool. Callers that
+// check several permissions in a row can pass a settings snapshot to avoid
+// re-fetching it per check.
+export function assertPermission(toolName: string, settingsSnapshot?: Settings): boolean {
+  const settings = settingsSnapshot || getSettings();
   if (!settings.permissions) return false;
   // If the toolName is not present, default to deny (safe approach)
   if (typeof settings.permissions[toolName] === 'boolean') {
@@ -86,10 +88,16 @@ export function assertPermission(toolName: string): boolean {
   return false;
 }
 
+// The settings path never changes for the lifetime of the process; resolve
+// it once instead of hitting app.getPath on every read and write.
+let settingsPathCache: string | null = null;
+
 function getSettingsPath(): string {
+  if (settingsPathCache) return settingsPathCache;
   const userDataPath = app.getPath('userData');
   const path = join(userDataPath, 'config', 'user-settings.json');
   if (process.env.NODE_ENV !== 'production') console.log('[DIAG] Config path resolved:', path);
+  settingsPathCache = path;
   return path;
 }
 
@@ -102,15 +110,27 @@ function ensureConfigDirectory(): void {
   }
 }
 
+// Settings are consulted on every permission check, so a disk read + JSON
+// parse per tool call adds up fast. Cache the merged settings in memory and
+// invalidate whenever this module writes the file; all writes go through
+// saveSettings, so the cache cannot go stale from within the app.
+let cachedSettings: Settings | null = null;
+
 export function getSettings(): Settings {
+  if (cachedSettings) {
+    // Shallow copy so callers that tweak top-level fields before saving do
+    // not silently mutate the cached object.
+    return { ...cachedSettings };
+  }
   try {
     const settingsPath = getSettingsPath();
-    
+
     if (!existsSync(settingsPath)) {
       if (process.env.NODE_ENV !== 'production') console.log('[DIAG] Settings file does not exist, using defaults:', settingsPath);
-      return { ...DEFAULT_SETTINGS };
+      cachedSettings = { ...DEFAULT_SETTINGS };
+      return { ...cachedSettings };
     }
-    
+
     const data = readFileSync(settingsPath, 'utf-8');
     const savedSettings = JSON.parse(data);
     if (process.env.NODE_ENV !== 'production') console.log('[DIAG] Settings loaded from:', settingsPath, 'keys:', Object.keys(savedSettings));
@@ -121,9 +141,11 @@ export function getSettings(): Settings {
     if (!merged.permissions) {
       merged.permissions = DEFAULT_SETTINGS.permissions;
     }
-    // If running in assessor demo mode, enforce safe defaults: telemetry off and dangerous permissions disabled
-    const demoMode = process.argv?.includes('--demo') || process.env.SADIE_DEMO_MODE === '1' || process.env.SADIE_DEMO_MODE === 'true';
-    if (demoMode) {
+    // If running in assessor demo mode, enforce safe defaults: telemetry off
+    // and dangerous permissions disabled. env.ts snapshots the argv/env
+    // probes once at startup, so reuse that instead of re-walking them on
+    // every settings load.
+    if (isDemoMode) {
       merged.telemetryEnabled = false;
       merged.telemetryConsentTimestamp = undefined;
       merged.telemetryConsentVersion = undefined;
@@ -136,9 +158,11 @@ export function getSettings(): Settings {
         screenshot: false
       };
     }
-    return merged;
+    cachedSettings = merged;
+    return { ...merged };
   } catch (error) {
     console.error('Failed to load settings:', error);
+    // Do not cache on transient read errors so the next call retries the disk
     return { ...DEFAULT_SETTINGS };
   }
 }
@@ -159,6 +183,7 @@ export function saveSettings(settings: Settings): void {
       toSave.telemetryConsentVersion = '1.0';
     }
     writeFileSync(settingsPath, JSON.stringify(toSave, null, 2), 'utf-8');
+    cachedSettings = null; // picked up fresh (with default/demo merging) on next read
     if (process.env.NODE_ENV !== 'production') console.log('[DIAG] Settings saved successfully to:', settingsPath);
     // Log consent changes
     try {
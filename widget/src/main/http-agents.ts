@@ -0,0 +1,19 @@
+/**
+ * Shared keep-alive HTTP agents for outbound requests from the main process.
+ *
+ * The hot path for chat and tool traffic is network round trips to n8n and
+ * Ollama on localhost (or a LAN host). Without keep-alive every axios call
+ * opens a fresh TCP connection (plus TLS for https endpoints); pooling the
+ * sockets removes that handshake from repeated calls.
+ */
+import * as http from 'http';
+import * as https from 'https';
+
+export const keepAliveHttpAgent = new http.Agent({ keepAlive: true, maxSockets: 16 });
+export const keepAliveHttpsAgent = new https.Agent({ keepAlive: true, maxSockets: 16 });
+
+/** Axios request config fragment that routes through the shared agents. */
+export const keepAliveAgents = {
+  httpAgent: keepAliveHttpAgent,
+  httpsAgent: keepAliveHttpsAgent,
+};
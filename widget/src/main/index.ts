@@ -17,8 +17,6 @@ function pushMainLog(line: string) {
 }
 // Expose a global push function for other modules
 (global as any).__SADIE_PUSH_MAIN_LOG = pushMainLog;
-import { createMainWindow } from './window-manager';
-import { registerIpcHandlers } from './ipc-handlers';
 import { sanitizeEnvForPackaged, isPackagedBuild } from './env';
 
 // Load environment variables
@@ -78,6 +76,12 @@ app.whenReady().then(() => {
     console.log(`[BUILD] mode=release; userData=${app.getPath('userData')}`);
   }
   if (process.env.NODE_ENV !== 'production') console.log('[DIAG] userData Path =', app.getPath('userData'));
+  // Heavy subsystems (ipc-handlers drags in axios, config and the memory
+  // manager; window-manager the renderer bootstrap) are required here rather
+  // than at module top, same as message-router below, so the process reaches
+  // Electron's ready event without paying for their import trees.
+  const { registerIpcHandlers } = require('./ipc-handlers');
+  const { createMainWindow } = require('./window-manager');
   // Register IPC handlers BEFORE window creation to satisfy early renderer invokes
   registerIpcHandlers();
   pushMainLog('Registered IPC handlers.');
@@ -3,6 +3,7 @@ import { getMainWindow } from './window-manager';
 import axios from 'axios';
 import * as path from 'path';
 import * as fs from 'fs';
+import { execFile } from 'child_process';
 import { getSettings, saveSettings } from './config-manager';
 import {
   MemoryManager,
@@ -31,6 +32,40 @@ const getSettingsPath = (): string => {
   return path.join(configDir, 'user-settings.json');
 };
 
+// PowerShell script for Windows SAPI dictation. The script never changes, so
+// it is flattened and quote-escaped once at module load instead of per
+// recognition request.
+const SPEECH_RECOGNITION_SCRIPT = `
+Add-Type -AssemblyName System.Speech
+$recognizer = New-Object System.Speech.Recognition.SpeechRecognitionEngine
+$recognizer.SetInputToDefaultAudioDevice()
+
+# Create a simple grammar that accepts any dictation
+$dictation = New-Object System.Speech.Recognition.DictationGrammar
+$recognizer.LoadGrammar($dictation)
+
+# Listen for 10 seconds max
+$recognizer.InitialSilenceTimeout = [TimeSpan]::FromSeconds(5)
+$recognizer.BabbleTimeout = [TimeSpan]::FromSeconds(3)
+$recognizer.EndSilenceTimeout = [TimeSpan]::FromSeconds(1)
+
+try {
+    $result = $recognizer.Recognize([TimeSpan]::FromSeconds(10))
+    if ($result -and $result.Text) {
+        Write-Output $result.Text
+    } else {
+        Write-Output ""
+    }
+} catch {
+    Write-Output ""
+} finally {
+    $recognizer.Dispose()
+}
+`;
+// execFile passes this as a single argument, so no shell quote-escaping —
+// only the newlines need flattening for -Command.
+const SPEECH_RECOGNITION_COMMAND = SPEECH_RECOGNITION_SCRIPT.replace(/\n/g, ' ');
+
 /**
  * Register all IPC handlers for communication between renderer and main process
  */
@@ -55,22 +90,31 @@ export function registerIpcHandlers(mainWindow?: BrowserWindow): void {
       const n8nBase = settings.n8nUrl || 'http://localhost:5678';
       const n8nHealth = `${n8nBase.replace(/\/$/, '')}/healthz`;
       const result = { n8n: 'checking', ollama: 'checking', lastChecked: new Date().toISOString() } as any;
-      try {
-        const r = await axios.get(n8nHealth, { timeout: 2000 });
-        if (r && r.status && r.status >= 200 && r.status < 300) result.n8n = 'online';
-        else result.n8n = 'offline';
-      } catch (e) {
-        result.n8n = 'offline';
-      }
 
-      try {
-        // Ollama may not expose /healthz; a simple GET on base URL will suffice for a quick check
-        const ollamaBase = process.env.OLLAMA_URL || DEFAULT_OLLAMA_URL;
-        const r2 = await axios.get(ollamaBase, { timeout: 2000 });
-        result.ollama = (r2 && r2.status && r2.status >= 200 && r2.status < 500) ? 'online' : 'offline';
-      } catch (e) {
-        result.ollama = 'offline';
-      }
+      // The two probes are independent, so run them concurrently — on a dead
+      // network this caps the wait at one 2s timeout instead of two in a row.
+      const checkN8n = async () => {
+        try {
+          const r = await axios.get(n8nHealth, { timeout: 2000 });
+          return (r && r.status && r.status >= 200 && r.status < 300) ? 'online' : 'offline';
+        } catch (e) {
+          return 'offline';
+        }
+      };
+      const checkOllama = async () => {
+        try {
+          // Ollama may not expose /healthz; a simple GET on base URL will suffice for a quick check
+          const ollamaBase = process.env.OLLAMA_URL || DEFAULT_OLLAMA_URL;
+          const r2 = await axios.get(ollamaBase, { timeout: 2000 });
+          return (r2 && r2.status && r2.status >= 200 && r2.status < 500) ? 'online' : 'offline';
+        } catch (e) {
+          return 'offline';
+        }
+      };
+
+      const [n8nStatus, ollamaStatus] = await Promise.all([checkN8n(), checkOllama()]);
+      result.n8n = n8nStatus;
+      result.ollama = ollamaStatus;
 
       result.lastChecked = new Date().toISOString();
       return result as { n8n: 'online'|'offline'|'checking'; ollama: 'online'|'offline'|'checking'; lastChecked: string };
@@ -351,40 +395,12 @@ export function registerIpcHandlers(mainWindow?: BrowserWindow): void {
    * Uses Windows SAPI through PowerShell
    */
   ipcMain.handle('sadie:start-speech-recognition', async () => {
-    const { exec } = require('child_process');
-    
     return new Promise((resolve) => {
-      // PowerShell script to use Windows Speech Recognition
-      const psScript = `
-Add-Type -AssemblyName System.Speech
-$recognizer = New-Object System.Speech.Recognition.SpeechRecognitionEngine
-$recognizer.SetInputToDefaultAudioDevice()
-
-# Create a simple grammar that accepts any dictation
-$dictation = New-Object System.Speech.Recognition.DictationGrammar
-$recognizer.LoadGrammar($dictation)
-
-# Listen for 10 seconds max
-$recognizer.InitialSilenceTimeout = [TimeSpan]::FromSeconds(5)
-$recognizer.BabbleTimeout = [TimeSpan]::FromSeconds(3)
-$recognizer.EndSilenceTimeout = [TimeSpan]::FromSeconds(1)
-
-try {
-    $result = $recognizer.Recognize([TimeSpan]::FromSeconds(10))
-    if ($result -and $result.Text) {
-        Write-Output $result.Text
-    } else {
-        Write-Output ""
-    }
-} catch {
-    Write-Output ""
-} finally {
-    $recognizer.Dispose()
-}
-`;
-
-      exec(`powershell -Command "${psScript.replace(/"/g, '\\"').replace(/\n/g, ' ')}"`, 
-        { timeout: 15000 }, 
+      // execFile launches PowerShell directly instead of going through
+      // cmd.exe, saving a process fork (and the quote-escaping that shell
+      // interpolation required) on every recognition.
+      execFile('powershell', ['-Command', SPEECH_RECOGNITION_COMMAND],
+        { timeout: 15000 },
         (error: any, stdout: string, stderr: string) => {
           if (error) {
             console.error('Speech recognition error:', error.message);
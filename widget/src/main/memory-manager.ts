@@ -7,25 +7,36 @@ import * as fs from 'fs';
 import * as path from 'path';
 import { app } from 'electron';
 import { Message, Settings } from '../shared/types';
+import { MAX_CONVERSATION_HISTORY } from '../shared/constants';
 
-// Resolve memory store path relative to app root (not asar)
+// Resolve memory store path relative to app root (not asar). The location is
+// fixed for the lifetime of the process, so resolve it once.
+let memoryStorePathCache: string | null = null;
 function getMemoryStorePath(): string {
+  if (memoryStorePathCache) return memoryStorePathCache;
   // In development, use the project's memory folder
   // In production, this would be relative to the app installation
   const isDev = !app.isPackaged;
   if (isDev) {
     // Go up from widget/dist/main to widget, then up to sadie root
-    return path.resolve(__dirname, '..', '..', '..', '..', 'memory', 'json-store');
+    memoryStorePathCache = path.resolve(__dirname, '..', '..', '..', '..', 'memory', 'json-store');
+  } else {
+    // In production, use userData folder for persistence
+    memoryStorePathCache = path.join(app.getPath('userData'), 'memory', 'json-store');
   }
-  // In production, use userData folder for persistence
-  return path.join(app.getPath('userData'), 'memory', 'json-store');
+  return memoryStorePathCache;
 }
 
-// Ensure directory exists
+// Ensure the store directory exists. It only needs to be created once per
+// process, so remember that instead of paying an existsSync/mkdir round trip
+// on every read and write.
+let storeDirEnsured = false;
 function ensureDir(dirPath: string): void {
+  if (storeDirEnsured) return;
   if (!fs.existsSync(dirPath)) {
     fs.mkdirSync(dirPath, { recursive: true });
   }
+  storeDirEnsured = true;
 }
 
 // Type definitions for stored data
@@ -113,13 +124,21 @@ function readJsonFile<T>(filename: string, defaultValue: T): T {
   return defaultValue;
 }
 
-function writeJsonFile<T>(filename: string, data: T): boolean {
+// `pretty` controls indentation: small config-like stores stay readable,
+// while hot, large stores (the conversation log) pass false to skip the
+// indentation pass and roughly halve the serialized size.
+function writeJsonFile<T>(filename: string, data: T, pretty: boolean = true): boolean {
   const storePath = getMemoryStorePath();
   ensureDir(storePath);
   const filePath = path.join(storePath, filename);
-  
+
   try {
-    fs.writeFileSync(filePath, JSON.stringify(data, null, 2), 'utf-8');
+    // Write to a temp file and rename over the target so a crash mid-write
+    // can never leave a truncated store behind; rename within a directory is
+    // atomic on every platform we ship to.
+    const tmpPath = `${filePath}.tmp`;
+    fs.writeFileSync(tmpPath, pretty ? JSON.stringify(data, null, 2) : JSON.stringify(data), 'utf-8');
+    fs.renameSync(tmpPath, filePath);
     return true;
   } catch (err) {
     console.error(`[MemoryManager] Error writing ${filename}:`, err);
@@ -142,12 +161,55 @@ export function savePreferences(prefs: Partial<UserPreferences>): UserPreference
 
 // ============= Conversations =============
 
+// In-memory singleton of the conversation store. Re-reading and re-parsing
+// the whole JSON file per operation is the JSON-store analog of opening a
+// fresh database connection per query; the main process is the only writer,
+// so one parsed copy can serve every call. saveConversationStore keeps the
+// cache and the file in step.
+let conversationStoreCache: ConversationStore | null = null;
+
 export function loadConversationStore(): ConversationStore {
-  return readJsonFile(STORE_FILES.conversations, DEFAULT_CONVERSATION_STORE);
+  if (!conversationStoreCache) {
+    // Fresh default object so cache mutations never touch the shared constant
+    conversationStoreCache = readJsonFile(STORE_FILES.conversations, {
+      ...DEFAULT_CONVERSATION_STORE,
+      conversations: [],
+    });
+  }
+  return conversationStoreCache;
+}
+
+// Write-behind: a single turn lands several store saves within milliseconds
+// (user message, assistant message, tool results, title update), and each
+// used to rewrite the whole file. Saves now update the in-memory store
+// immediately and coalesce the disk write behind a short timer; the exit
+// hook below flushes whatever is still pending on shutdown.
+const CONVERSATION_FLUSH_DELAY_MS = 200;
+let conversationFlushTimer: NodeJS.Timeout | null = null;
+
+function flushConversationStore(): boolean {
+  if (conversationFlushTimer) {
+    clearTimeout(conversationFlushTimer);
+    conversationFlushTimer = null;
+  }
+  if (!conversationStoreCache) return true;
+  // The conversation store is rewritten on every flush; compact output
+  // keeps that write proportional to the data, not the indentation.
+  return writeJsonFile(STORE_FILES.conversations, conversationStoreCache, false);
 }
 
+process.on('exit', () => { flushConversationStore(); });
+
 export function saveConversationStore(store: ConversationStore): boolean {
-  return writeJsonFile(STORE_FILES.conversations, store);
+  conversationStoreCache = store;
+  if (!conversationFlushTimer) {
+    conversationFlushTimer = setTimeout(() => {
+      conversationFlushTimer = null;
+      flushConversationStore();
+    }, CONVERSATION_FLUSH_DELAY_MS);
+    if (typeof conversationFlushTimer.unref === 'function') conversationFlushTimer.unref();
+  }
+  return true;
 }
 
 export function getConversation(conversationId: string): StoredConversation | null {
@@ -208,51 +270,77 @@ export function createNewConversation(title?: string): StoredConversation {
 }
 
 export function addMessageToConversation(conversationId: string, message: Message): boolean {
-  const conversation = getConversation(conversationId);
+  // Load the store once and mutate the conversation in place. Going through
+  // getConversation + saveConversation read the full store from disk twice
+  // per appended message.
+  const store = loadConversationStore();
+  const conversation = store.conversations.find(c => c.id === conversationId);
   if (!conversation) {
     return false;
   }
-  
+
   // Ensure message has an ID
   const messageWithId: Message = {
     ...message,
     id: message.id || `msg_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`,
   };
-  
+
   conversation.messages.push(messageWithId);
-  
+
+  // Trim to the shared history cap as messages arrive. Doing it on append
+  // keeps the trim O(overflow) — normally a single shift — instead of
+  // letting conversations grow without bound and paying for the excess on
+  // every serialize.
+  if (conversation.messages.length > MAX_CONVERSATION_HISTORY) {
+    conversation.messages.splice(0, conversation.messages.length - MAX_CONVERSATION_HISTORY);
+  }
+
   // Auto-generate title from first user message if still default
   if (conversation.messages.length === 1 && message.role === 'user') {
     const preview = message.content.slice(0, 50);
     conversation.title = preview + (message.content.length > 50 ? '...' : '');
   }
-  
-  return saveConversation(conversation);
+
+  conversation.updatedAt = new Date().toISOString();
+  return saveConversationStore(store);
 }
 
 export function updateMessageInConversation(
-  conversationId: string, 
-  messageId: string, 
+  conversationId: string,
+  messageId: string,
   updates: Partial<Message>
 ): boolean {
-  const conversation = getConversation(conversationId);
+  const store = loadConversationStore();
+  const conversation = store.conversations.find(c => c.id === conversationId);
   if (!conversation) return false;
-  
+
   const msgIndex = conversation.messages.findIndex(m => m.id === messageId);
   if (msgIndex === -1) return false;
-  
+
   conversation.messages[msgIndex] = {
     ...conversation.messages[msgIndex],
     ...updates,
   };
-  
-  return saveConversation(conversation);
+
+  conversation.updatedAt = new Date().toISOString();
+  return saveConversationStore(store);
 }
 
 // ============= Tool Usage Stats =============
 
+// Same single-writer argument as the conversation store: stats are only
+// mutated here, so one parsed copy serves every recordToolUsage call instead
+// of a read + parse of the file per tool invocation.
+let toolStatsCache: ToolUsageStats | null = null;
+
 export function loadToolStats(): ToolUsageStats {
-  return readJsonFile(STORE_FILES.toolStats, DEFAULT_TOOL_STATS);
+  if (!toolStatsCache) {
+    toolStatsCache = readJsonFile(STORE_FILES.toolStats, {
+      ...DEFAULT_TOOL_STATS,
+      toolUsage: {},
+    });
+  }
+  return toolStatsCache;
 }
 
 export function recordToolUsage(toolName: string): void {
@@ -1,8 +1,9 @@
 import { ipcMain, BrowserWindow, IpcMainEvent } from 'electron';
 import type { IpcMainInvokeEvent } from 'electron';
 import { permissionRequester } from './permission-requester';
-import { looksLikeToolJson } from './tool-helpers';
+import { looksLikeToolJson, extractToolJson } from './tool-helpers';
 import axios from 'axios';
+import { keepAliveAgents } from './http-agents';
 import { debug as logDebug, error as logError, info as logInfo } from '../shared/logger';
 import streamFromSadieProxy from './stream-proxy-client';
 import { SadieRequest, SadieResponse, SadieRequestWithImages, ImageAttachment, DocumentAttachment } from '../shared/types';
@@ -19,6 +20,42 @@ const PACKAGED = isPackagedBuild;
 const DEFAULT_TIMEOUT = 30000;
 const OLLAMA_URL = process.env.OLLAMA_URL || DEFAULT_OLLAMA_URL;
 
+// Webhook URLs are stable per n8n base URL; build each one once instead of
+// re-concatenating the template string on every message.
+const webhookUrlCache = new Map<string, string>();
+function getWebhookUrl(n8nUrl: string): string {
+  let url = webhookUrlCache.get(n8nUrl);
+  if (!url) {
+    url = `${n8nUrl}${SADIE_WEBHOOK_PATH}`;
+    webhookUrlCache.set(n8nUrl, url);
+  }
+  return url;
+}
+
+// Circuit breaker for the n8n webhook: once several requests in a row fail,
+// fail fast for a short cooldown instead of making every queued message wait
+// out the full 30s timeout against a dead orchestrator. First success resets.
+const N8N_BREAKER_THRESHOLD = 3;
+const N8N_BREAKER_COOLDOWN_MS = 30 * 1000;
+let n8nConsecutiveFailures = 0;
+let n8nBreakerOpenUntil = 0;
+
+function isN8nBreakerOpen(): boolean {
+  return n8nConsecutiveFailures >= N8N_BREAKER_THRESHOLD && Date.now() < n8nBreakerOpenUntil;
+}
+
+function recordN8nSuccess() {
+  n8nConsecutiveFailures = 0;
+}
+
+function recordN8nFailure() {
+  n8nConsecutiveFailures++;
+  if (n8nConsecutiveFailures >= N8N_BREAKER_THRESHOLD) {
+    n8nBreakerOpenUntil = Date.now() + N8N_BREAKER_COOLDOWN_MS;
+    try { pushRouter(`n8n circuit breaker open for ${N8N_BREAKER_COOLDOWN_MS / 1000}s after ${n8nConsecutiveFailures} consecutive failures`); } catch (e) {}
+  }
+}
+
 // Router diagnostics buffer for capture tool
 (global as any).__SADIE_ROUTER_LOG_BUFFER ??= [];
 function pushRouter(line: string) {
@@ -60,9 +97,9 @@ function validateImages(images?: any[]) {
  * Parse documents and return their text content to be included in the message context
  */
 async function parseDocuments(documents: DocumentAttachment[]): Promise<string[]> {
-  const parsedTexts: string[] = [];
-  
-    for (const doc of documents) {
+  // Documents are independent, so parse them concurrently; the output array
+  // preserves attachment order.
+  const parsedTexts = await Promise.all(documents.map(async (doc): Promise<string | null> => {
     try {
       const result = await documentToolHandlers.parse_document({
         document_id: doc.id,
@@ -70,27 +107,28 @@ async function parseDocuments(documents: DocumentAttachment[]): Promise<string[]
         data: doc.data,
         mime_type: doc.mimeType
       }, { executionId: `parse-${Date.now()}` });
-      
+
       if (result.success && result.result) {
         // Get the full content
         const contentResult = await documentToolHandlers.get_document_content({
           document_id: doc.id
         }, { executionId: `content-${Date.now()}` });
-        
+
         if (contentResult.success && contentResult.result?.content) {
-          parsedTexts.push(`=== Document: ${doc.filename} ===\n${contentResult.result.content}\n=== End of ${doc.filename} ===`);
+          return `=== Document: ${doc.filename} ===\n${contentResult.result.content}\n=== End of ${doc.filename} ===`;
         }
-      } else {
-        console.error(`[SADIE] Failed to parse document ${doc.filename}:`, result.error);
-        parsedTexts.push(`[Failed to parse document: ${doc.filename} - ${result.error}]`);
+        return null;
       }
+
+      console.error(`[SADIE] Failed to parse document ${doc.filename}:`, result.error);
+      return `[Failed to parse document: ${doc.filename} - ${result.error}]`;
     } catch (err: any) {
       console.error(`[SADIE] Error parsing document ${doc.filename}:`, err);
-      parsedTexts.push(`[Error parsing document: ${doc.filename} - ${err.message}]`);
+      return `[Error parsing document: ${doc.filename} - ${err.message}]`;
     }
-  }
-  
-  return parsedTexts;
+  }));
+
+  return parsedTexts.filter((t): t is string => t !== null);
 }
 
 // Track active streams (Node Readable) by streamId so we can cancel them
@@ -108,18 +146,27 @@ interface ConversationMessage {
 // Store conversation history by conversation_id (limited to last N messages)
 const conversationHistory: Map<string, ConversationMessage[]> = new Map();
 const MAX_HISTORY_MESSAGES = 20; // Keep last 20 messages per conversation
+const MAX_TRACKED_CONVERSATIONS = 50; // Cap resident history buffers
 
 function addToHistory(conversationId: string, role: 'user' | 'assistant', content: string) {
-  if (!conversationHistory.has(conversationId)) {
-    conversationHistory.set(conversationId, []);
+  // Single map lookup instead of the has/set/get triple
+  let history = conversationHistory.get(conversationId);
+  if (!history) {
+    // Evict the least recently created conversation so long sessions cannot
+    // grow the map without bound (Map preserves insertion order).
+    if (conversationHistory.size >= MAX_TRACKED_CONVERSATIONS) {
+      const oldest = conversationHistory.keys().next().value;
+      if (oldest !== undefined) conversationHistory.delete(oldest);
+    }
+    history = [];
+    conversationHistory.set(conversationId, history);
   }
-  
-  const history = conversationHistory.get(conversationId)!;
   history.push({ role, content, timestamp: Date.now() });
-  
-  // Trim to max size
-  while (history.length > MAX_HISTORY_MESSAGES) {
-    history.shift();
+
+  // Trim to max size in one splice; shift() in a loop re-indexes the whole
+  // array once per evicted message.
+  if (history.length > MAX_HISTORY_MESSAGES) {
+    history.splice(0, history.length - MAX_HISTORY_MESSAGES);
   }
 }
 
@@ -163,7 +210,9 @@ function mapErrorToSadieResponse(error: any): SadieResponse {
 // and imported directly by unit tests.
 export async function preProcessIntent(userMessage: string): Promise<{ calls: any[] } | null> {
   if (!userMessage || typeof userMessage !== 'string') return null;
-  const m = userMessage.toLowerCase();
+  // Every pattern below is case-insensitive already, so matching the raw
+  // message directly avoids allocating a lowercased copy per call.
+  const m = userMessage;
 
   // SPORTS / NBA intents
   if (/\b(nba|nba\s|nba:|\bgame(s)?\b|\bscores?\b|\bteam\b)/i.test(m)) {
@@ -215,6 +264,17 @@ export async function analyzeAndRouteMessage(message: string): Promise<RoutingDe
 // Summarize tool results into a human-readable assistant message. Keep this
 // deterministic and brief so the UI can present a helpful summary after tools
 // execute.
+// Stringify a tool result for display without serializing multi-KB payloads
+// in full: long strings (file contents, fetched pages) are truncated before
+// JSON.stringify runs, then the output is clamped to the limit.
+function stringifyBounded(value: any, limit: number): string {
+  const s = JSON.stringify(value, (_key, v) =>
+    typeof v === 'string' && v.length > limit ? v.slice(0, limit) + '…' : v
+  );
+  if (!s) return '';
+  return s.length > limit ? s.slice(0, limit) : s;
+}
+
 function summarizeToolResults(results: any[]): string {
   if (!results || results.length === 0) return 'No results returned from tools.';
   const parts: string[] = [];
@@ -230,9 +290,9 @@ function summarizeToolResults(results: any[]): string {
       // Try to stringify concise keys
       if (r.result.summary) parts.push(r.result.summary);
       else if (r.result.content) parts.push(r.result.content);
-      else parts.push(JSON.stringify(r.result).slice(0, 400));
+      else parts.push(stringifyBounded(r.result, 400));
     } else if (r.output && typeof r.output === 'string') parts.push(r.output);
-    else parts.push(JSON.stringify(r).slice(0, 400));
+    else parts.push(stringifyBounded(r, 400));
   }
   return parts.join('\n\n');
 }
@@ -312,11 +372,21 @@ export async function processIncomingRequest(request: SadieRequestWithImages | S
 
     // Only if decision.type === 'llm' do we call the upstream orchestrator/webhook.
     if (decision.type === 'llm') {
-      const response = await axios.post(`${n8nUrl}${SADIE_WEBHOOK_PATH}`, request, {
-        timeout: DEFAULT_TIMEOUT,
-        headers: { 'Content-Type': 'application/json' }
-      });
-      return { success: true, data: response.data };
+      if (isN8nBreakerOpen()) {
+        return { success: false, error: true, message: 'SADIE backend (n8n) is unavailable right now. Please retry in a moment.' };
+      }
+      try {
+        const response = await axios.post(getWebhookUrl(n8nUrl), request, {
+          timeout: DEFAULT_TIMEOUT,
+          headers: { 'Content-Type': 'application/json' },
+          ...keepAliveAgents
+        });
+        recordN8nSuccess();
+        return { success: true, data: response.data };
+      } catch (webhookErr) {
+        recordN8nFailure();
+        throw webhookErr;
+      }
     }
 
     return { success: false, error: true, message: 'Unhandled routing decision' };
@@ -353,6 +423,25 @@ interface ChatMessage {
   tool_calls?: any[];
 }
 
+// The system prompt never changes at runtime, so build its chat message once
+// instead of allocating a fresh object on every request and fallback.
+const SYSTEM_MESSAGE: ChatMessage = Object.freeze({ role: 'system', content: SADIE_SYSTEM_PROMPT }) as ChatMessage;
+
+// Aliases for tool names coming from models that may use different names
+const TOOL_ALIASES: Record<string, string> = { nba_scores: 'nba_query' };
+
+function normalizeToolCalls(toolCalls: any[]): ToolCall[] {
+  return toolCalls.map((c: any) => {
+    const toolName = c.function?.name || c.name;
+    const normalizedName = TOOL_ALIASES[toolName] || toolName;
+    let toolArgs = c.function?.arguments || c.arguments || {};
+    if (typeof toolArgs === 'string') {
+      try { toolArgs = JSON.parse(toolArgs); } catch { }
+    }
+    return { name: normalizedName, arguments: toolArgs } as any;
+  });
+}
+
 // Stream from Ollama with tool calling support
 export async function streamFromOllamaWithTools(
   message: string, 
@@ -398,8 +487,16 @@ export async function streamFromOllamaWithTools(
     for (const img of images) {
       let base64 = img.data || img.base64 || '';
       if (!base64 && img.dataUrl) {
-        const match = img.dataUrl.match(/^data:[^;]+;base64,(.+)$/);
-        if (match) base64 = match[1];
+        // Split on the first comma instead of regex-capturing the payload;
+        // on a multi-megabyte data URL the regex walks and copies the whole
+        // body just to strip a ~20-char header.
+        const comma = img.dataUrl.indexOf(',');
+        if (comma !== -1) {
+          const header = img.dataUrl.slice(0, comma);
+          if (header.startsWith('data:') && header.endsWith(';base64')) {
+            base64 = img.dataUrl.slice(comma + 1);
+          }
+        }
       }
       if (base64) {
         imageData.push(base64);
@@ -410,7 +507,7 @@ export async function streamFromOllamaWithTools(
   // Build messages array for chat API - include conversation history
   const history = getHistory(conversationId);
   const messages: ChatMessage[] = [
-    { role: 'system', content: SADIE_SYSTEM_PROMPT },
+    SYSTEM_MESSAGE,
   ];
   
   // Add conversation history (last N messages for context)
@@ -452,7 +549,8 @@ export async function streamFromOllamaWithTools(
       const response = await axios.post(`${OLLAMA_URL}/api/chat`, requestBody, {
         responseType: 'stream',
         timeout: 0,
-        signal: controller.signal
+        signal: controller.signal,
+        ...keepAliveAgents
       });
 
       console.log('[SADIE] Ollama chat stream connected...');
@@ -460,38 +558,75 @@ export async function streamFromOllamaWithTools(
       
       let assistantContent = '';
       let pendingToolCalls: any[] = [];
-      
+      // Batch kicked off as soon as the model emits tool_calls, so execution
+      // overlaps with the rest of the generation stream.
+      let earlyBatch: { calls: ToolCall[]; promise: Promise<any[]> } | null = null;
+
+      // Network chunks don't align with Ollama's newline-delimited JSON, so
+      // carry the trailing partial line over to the next chunk instead of
+      // dropping it — previously a JSON line split across two chunks (and any
+      // lines after it in the same chunk) was silently lost.
+      let streamRemainder = '';
+
+      const handleStreamLine = (line: string, resolve: () => void) => {
+        let parsed: any;
+        try {
+          parsed = JSON.parse(line);
+        } catch (e) {
+          // Malformed line; skip it without affecting its neighbours
+          return;
+        }
+
+        // Handle content chunks
+        if (parsed.message?.content) {
+          chunkCount++;
+          assistantContent += parsed.message.content;
+          onChunk(parsed.message.content);
+        }
+
+        // Handle tool calls — dispatch the batch immediately so tool
+        // I/O runs while the model is still streaming tokens.
+        if (parsed.message?.tool_calls) {
+          pendingToolCalls = parsed.message.tool_calls;
+          if (!earlyBatch) {
+            const calls = normalizeToolCalls(pendingToolCalls);
+            const promise = executeToolBatch(calls, toolContext);
+            // Swallow rejections until awaited below so a stream error
+            // cannot surface as an unhandled rejection.
+            promise.catch(() => {});
+            earlyBatch = { calls, promise };
+          }
+        }
+
+        if (parsed.done) {
+          console.log(`[SADIE] Response done, chunks=${chunkCount}, toolCalls=${pendingToolCalls.length}`);
+          resolve();
+        }
+      };
+
       await new Promise<void>((resolve, reject) => {
         stream.on('data', (chunk: Buffer) => {
           try {
-            const lines = chunk.toString('utf8').split('\n').filter(line => line.trim());
+            streamRemainder += chunk.toString('utf8');
+            const lines = streamRemainder.split('\n');
+            streamRemainder = lines.pop() || '';
             for (const line of lines) {
-              if (!line) continue;
-              const parsed = JSON.parse(line);
-              
-              // Handle content chunks
-              if (parsed.message?.content) {
-                chunkCount++;
-                assistantContent += parsed.message.content;
-                onChunk(parsed.message.content);
-              }
-              
-              // Handle tool calls
-              if (parsed.message?.tool_calls) {
-                pendingToolCalls = parsed.message.tool_calls;
-              }
-              
-              if (parsed.done) {
-                console.log(`[SADIE] Response done, chunks=${chunkCount}, toolCalls=${pendingToolCalls.length}`);
-                resolve();
-              }
+              if (!line.trim()) continue;
+              handleStreamLine(line, resolve);
             }
           } catch (e) {
-            // Partial JSON, ignore
+            // Defensive: a handler error must not kill the stream
           }
         });
-        
-        stream.on('end', resolve);
+
+        stream.on('end', () => {
+          // Flush any final line that arrived without a trailing newline
+          if (streamRemainder.trim()) {
+            try { handleStreamLine(streamRemainder, resolve); } catch (e) {}
+            streamRemainder = '';
+          }
+          resolve();
+        });
         stream.on('error', reject);
       });
       
@@ -499,14 +634,12 @@ export async function streamFromOllamaWithTools(
       // looks like raw tool JSON, parse and route it through the tool
       // execution pipeline rather than rendering it as plain text.
       if (pendingToolCalls.length === 0 && looksLikeToolJson(assistantContent)) {
-        try {
-          const parsed = JSON.parse(assistantContent);
-          if (parsed && (parsed.name || parsed.function)) {
-            pendingToolCalls = [parsed];
-            assistantContent = "I'm fetching that now...";
-            pushRouter('Detected inline tool JSON; routing to tool executor');
-          }
-        } catch (e) {}
+        const parsed = extractToolJson(assistantContent);
+        if (parsed) {
+          pendingToolCalls = [parsed];
+          assistantContent = "I'm fetching that now...";
+          pushRouter('Detected inline tool JSON; routing to tool executor');
+        }
       }
 
       // Process tool calls if any
@@ -520,19 +653,10 @@ export async function streamFromOllamaWithTools(
         });
         
         // Execute tool calls as an atomic batch (precheck permissions to avoid
-        // partial execution like creating a folder then failing to write a file)
-        const TOOL_ALIASES: Record<string, string> = { nba_scores: 'nba_query' };
-        const calls = pendingToolCalls.map((c: any) => {
-          const toolName = c.function?.name || c.name;
-          const normalizedName = TOOL_ALIASES[toolName] || toolName;
-          let toolArgs = c.function?.arguments || c.arguments || {};
-          if (typeof toolArgs === 'string') {
-            try { toolArgs = JSON.parse(toolArgs); } catch { }
-          }
-          return { name: normalizedName, arguments: toolArgs } as any;
-        });
-
-        const batchResults = await executeToolBatch(calls, toolContext);
+        // partial execution like creating a folder then failing to write a file).
+        // When the batch was started mid-stream, just await its result here.
+        const calls = earlyBatch ? (earlyBatch as any).calls : normalizeToolCalls(pendingToolCalls);
+        const batchResults = earlyBatch ? await (earlyBatch as any).promise : await executeToolBatch(calls, toolContext);
 
         // If batch indicates missing permissions, request user approval
         if (batchResults.length === 1 && batchResults[0].success === false && (batchResults[0] as any).status === 'needs_confirmation') {
@@ -935,9 +1059,9 @@ export function registerMessageRouter(mainWindow: BrowserWindow, n8nUrl: string)
             // Attempt a non-streaming fallback via n8n webhook before emitting an error
             (async () => {
               try {
-                const fallbackUrl = `${n8nUrl}${SADIE_WEBHOOK_PATH}`;
+                const fallbackUrl = getWebhookUrl(n8nUrl);
                 if (process.env.NODE_ENV !== 'production') console.log('[Router] Attempting non-stream fallback to', fallbackUrl, 'for streamId', streamId);
-                const fallbackRes = await axios.post(fallbackUrl, request, { timeout: DEFAULT_TIMEOUT });
+                const fallbackRes = await axios.post(fallbackUrl, request, { timeout: DEFAULT_TIMEOUT, ...keepAliveAgents });
                 const finalText = fallbackRes?.data?.message?.content || (fallbackRes?.data && JSON.stringify(fallbackRes.data));
                 if (finalText) {
                   try { event.sender.send('sadie:stream-chunk', { chunk: finalText, streamId }); } catch (e) {}
@@ -972,7 +1096,7 @@ export function registerMessageRouter(mainWindow: BrowserWindow, n8nUrl: string)
             try {
               const safetyUrl = `${n8nUrl}/webhook/sadie/validate`;
               if (process.env.NODE_ENV !== 'production') logDebug('[Router] Running safety check', { safetyUrl });
-              const safetyRes = await axios.post(safetyUrl, { tool_call: reqAny.tool_call }, { timeout: DEFAULT_TIMEOUT });
+              const safetyRes = await axios.post(safetyUrl, { tool_call: reqAny.tool_call }, { timeout: DEFAULT_TIMEOUT, ...keepAliveAgents });
               if (safetyRes?.data?.status === 'blocked') {
                 // Safety blocked - return an error to the renderer and stop
                 try { event.sender.send('sadie:stream-error', { error: true, message: 'Safety blocked', details: safetyRes.data, streamId }); } catch (e) {}
@@ -1024,10 +1148,10 @@ export function registerMessageRouter(mainWindow: BrowserWindow, n8nUrl: string)
                   try {
                     const fallbackBody = {
                       model: uncensoredModeEnabled ? OLLAMA_UNCENSORED_MODEL : OLLAMA_CHAT_MODEL,
-                      messages: [ { role: 'system', content: SADIE_SYSTEM_PROMPT }, { role: 'user', content: reqAny.message } ],
+                      messages: [ SYSTEM_MESSAGE, { role: 'user', content: reqAny.message } ],
                       stream: false
                     };
-                    const fallbackRes = await axios.post(`${OLLAMA_URL}/api/chat`, fallbackBody, { timeout: DEFAULT_TIMEOUT });
+                    const fallbackRes = await axios.post(`${OLLAMA_URL}/api/chat`, fallbackBody, { timeout: DEFAULT_TIMEOUT, ...keepAliveAgents });
                     const finalText = fallbackRes?.data?.message?.content || (fallbackRes?.data && JSON.stringify(fallbackRes.data));
                     if (finalText) {
                       try { event.sender.send('sadie:stream-chunk', { chunk: finalText, streamId }); } catch (e) {}
@@ -1056,10 +1180,10 @@ export function registerMessageRouter(mainWindow: BrowserWindow, n8nUrl: string)
             try {
               const fallbackBody = {
                 model: uncensoredModeEnabled ? OLLAMA_UNCENSORED_MODEL : OLLAMA_CHAT_MODEL,
-                messages: [ { role: 'system', content: SADIE_SYSTEM_PROMPT }, { role: 'user', content: reqAny.message } ],
+                messages: [ SYSTEM_MESSAGE, { role: 'user', content: reqAny.message } ],
                 stream: false
               };
-              const fallbackRes = await axios.post(`${OLLAMA_URL}/api/chat`, fallbackBody, { timeout: DEFAULT_TIMEOUT });
+              const fallbackRes = await axios.post(`${OLLAMA_URL}/api/chat`, fallbackBody, { timeout: DEFAULT_TIMEOUT, ...keepAliveAgents });
               const finalText = fallbackRes?.data?.message?.content || (fallbackRes?.data && JSON.stringify(fallbackRes.data));
               if (finalText) {
                 try { event.sender.send('sadie:stream-chunk', { chunk: finalText, streamId }); } catch (e) {}
@@ -1084,10 +1208,10 @@ export function registerMessageRouter(mainWindow: BrowserWindow, n8nUrl: string)
             try {
               const fallbackBody = {
                 model: uncensoredModeEnabled ? OLLAMA_UNCENSORED_MODEL : OLLAMA_CHAT_MODEL,
-                messages: [ { role: 'system', content: SADIE_SYSTEM_PROMPT }, { role: 'user', content: reqAny.message } ],
+                messages: [ SYSTEM_MESSAGE, { role: 'user', content: reqAny.message } ],
                 stream: false
               };
-              const fallbackRes = await axios.post(`${OLLAMA_URL}/api/chat`, fallbackBody, { timeout: DEFAULT_TIMEOUT });
+              const fallbackRes = await axios.post(`${OLLAMA_URL}/api/chat`, fallbackBody, { timeout: DEFAULT_TIMEOUT, ...keepAliveAgents });
               // Parse and send final assistant content
               try {
                 const finalText = fallbackRes?.data?.message?.content || (fallbackRes?.data && JSON.stringify(fallbackRes.data));
@@ -25,19 +25,41 @@ export interface ModelStatus {
 class OfflineSpeechRecognition {
   private status: ModelStatus = { ready: false, loading: false };
   private modelName: string = 'Xenova/whisper-tiny.en';
+  // In-flight initialization, shared so overlapping callers (warm-up plus a
+  // transcribe racing in behind it) await the same load instead of one of
+  // them reporting failure or kicking off a second download.
+  private initPromise: Promise<boolean> | null = null;
 
   getStatus(): ModelStatus {
     return { ...this.status };
   }
 
+  /**
+   * Kick off the model load without waiting for it. Callers should fire
+   * this the moment recording starts so the download/init overlaps the
+   * user speaking instead of serializing record → load → transcribe;
+   * failures surface through getStatus and again on transcribe.
+   */
+  warmUp(window: BrowserWindow): void {
+    if (this.status.ready || this.status.loading) return;
+    this.initializeInRenderer(window).catch(() => { /* reported via status */ });
+  }
+
   /**
    * Initialize the model in the renderer process
    * This will download the model on first use (~75MB for tiny.en)
    */
   async initializeInRenderer(window: BrowserWindow): Promise<boolean> {
     if (this.status.ready) return true;
-    if (this.status.loading) return false;
+    if (this.initPromise) return this.initPromise;
 
+    this.initPromise = this.doInitialize(window).finally(() => {
+      this.initPromise = null;
+    });
+    return this.initPromise;
+  }
+
+  private async doInitialize(window: BrowserWindow): Promise<boolean> {
     this.status.loading = true;
 
     try {
@@ -59,8 +81,12 @@ class OfflineSpeechRecognition {
             // This will download the model on first use
             window.sadieWhisperPipeline = await pipeline(
               'automatic-speech-recognition',
-              'Xenova/whisper-tiny.en',
-              { 
+              ${JSON.stringify(this.modelName)},
+              {
+                // int8 ONNX weights: ~4x smaller download and the matmuls
+                // run on int8 kernels, which is the fast path for CPU
+                // inference in onnxruntime-web.
+                quantized: true,
                 progress_callback: (progress) => {
                   if (progress.status === 'progress') {
                     console.log('[SADIE] Model loading:', Math.round(progress.progress) + '%');
@@ -81,6 +107,7 @@ class OfflineSpeechRecognition {
       if (result.success) {
         this.status.ready = true;
         this.status.loading = false;
+        this.status.modelName = this.modelName;
         console.log('[SADIE Speech] Offline recognition ready');
         return true;
       } else {
@@ -102,7 +129,13 @@ class OfflineSpeechRecognition {
    */
   async transcribe(window: BrowserWindow, audioData: string): Promise<TranscriptionResult> {
     if (!this.status.ready) {
-      await this.initializeInRenderer(window);
+      const ok = await this.initializeInRenderer(window);
+      // Bail before serializing the audio below: embedding megabytes of
+      // base64 into an injected script just to hear 'Model not loaded'
+      // back from the renderer is a wasted round trip.
+      if (!ok) {
+        throw new Error(this.status.error || 'Model not loaded');
+      }
     }
 
     const result = await window.webContents.executeJavaScript(`
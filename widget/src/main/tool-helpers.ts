@@ -2,5 +2,54 @@ export function looksLikeToolJson(content: string): boolean {
   if (!content || typeof content !== 'string') return false;
   const t = content.trim();
   if (!t.startsWith('{') && !t.startsWith('[')) return false;
-  return /"parameters"|"arguments"/.test(t) && /"name"/.test(t);
+  // The markers are literal strings, so plain substring checks beat the
+  // regex alternation this used to run — and normal chat turns bail out on
+  // the cheap '"name"' check before scanning for the rest.
+  if (!t.includes('"name"')) return false;
+  return t.includes('"parameters"') || t.includes('"arguments"');
+}
+
+// Scan forward from `start` (which must point at '{') and return the index of
+// the matching '}', honouring string literals and escapes so braces inside
+// argument strings (e.g. code snippets) are not treated as structural.
+// Returns -1 if the object never closes.
+function scanBalancedObject(content: string, start: number): number {
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+  for (let i = start; i < content.length; i++) {
+    const ch = content[i];
+    if (inString) {
+      if (escaped) escaped = false;
+      else if (ch === '\\') escaped = true;
+      else if (ch === '"') inString = false;
+      continue;
+    }
+    if (ch === '"') inString = true;
+    else if (ch === '{') depth++;
+    else if (ch === '}') {
+      depth--;
+      if (depth === 0) return i;
+    }
+  }
+  return -1;
+}
+
+// Extract the first tool-call object (something with a `name` or `function`
+// key) embedded in model output. Unlike a whole-string JSON.parse, this
+// tolerates trailing tokens after the object and advances past each failed
+// candidate instead of rescanning, so it stays linear in the content length.
+export function extractToolJson(content: string): any | null {
+  if (!content || typeof content !== 'string') return null;
+  let start = content.indexOf('{');
+  while (start !== -1) {
+    const end = scanBalancedObject(content, start);
+    if (end === -1) return null; // unterminated — nothing further can parse
+    try {
+      const parsed = JSON.parse(content.slice(start, end + 1));
+      if (parsed && (parsed.name || parsed.function)) return parsed;
+    } catch (e) {}
+    start = content.indexOf('{', end + 1);
+  }
+  return null;
 }
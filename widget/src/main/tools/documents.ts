@@ -43,6 +43,18 @@ interface ParsedDocument {
 // In-memory store for parsed documents (cleared on restart)
 const parsedDocuments = new Map<string, ParsedDocument>();
 
+// Re-uploading the same attachment gets a fresh document_id, so the
+// per-id dedupe in parse_document misses and the PDF/Word extraction runs
+// again on identical bytes. Memoize extraction results behind a cheap
+// fingerprint — name, length and the first/last bytes of the payload —
+// the in-memory analog of keying a cache on (path, mtime, size).
+const PARSE_CACHE_MAX = 8;
+const parseCache = new Map<string, { text: string; pageCount?: number }>();
+
+function parseFingerprint(data: string, filename: string): string {
+  return `${filename}|${data.length}|${data.slice(0, 64)}|${data.slice(-64)}`;
+}
+
 /**
  * Parse document content from base64 data
  */
@@ -50,6 +62,24 @@ async function parseDocumentContent(
   data: string,
   mimeType: string,
   filename: string
+): Promise<{ text: string; pageCount?: number }> {
+  const fingerprint = parseFingerprint(data, filename);
+  const cached = parseCache.get(fingerprint);
+  if (cached) return cached;
+
+  const result = await parseDocumentBuffer(data, mimeType, filename);
+  parseCache.set(fingerprint, result);
+  if (parseCache.size > PARSE_CACHE_MAX) {
+    const oldest = parseCache.keys().next().value;
+    if (oldest !== undefined) parseCache.delete(oldest);
+  }
+  return result;
+}
+
+async function parseDocumentBuffer(
+  data: string,
+  mimeType: string,
+  filename: string
 ): Promise<{ text: string; pageCount?: number }> {
   // Decode base64 to buffer
   const buffer = Buffer.from(data, 'base64');
@@ -352,31 +382,39 @@ export const documentToolHandlers: Record<string, ToolHandler> = {
       // Split into lines for context
       const lines = doc.text.split('\n');
       const searchQuery = case_sensitive ? query : query.toLowerCase();
+      const MAX_MATCHES = 20;
       const matches: { line_number: number; context: string }[] = [];
-      
+      let matchCount = 0;
+
       for (let i = 0; i < lines.length; i++) {
         const line = case_sensitive ? lines[i] : lines[i].toLowerCase();
-        
+
         if (line.includes(searchQuery)) {
-          // Get context lines
-          const start = Math.max(0, i - context_lines);
-          const end = Math.min(lines.length - 1, i + context_lines);
-          const contextLines = lines.slice(start, end + 1);
-          
-          matches.push({
-            line_number: i + 1, // 1-indexed
-            context: contextLines.join('\n')
-          });
+          matchCount++;
+          // Only the first MAX_MATCHES are returned, so past that point just
+          // keep counting instead of joining context strings that get
+          // discarded — on a big document with a common query the extra
+          // contexts dominated the handler's memory use.
+          if (matches.length < MAX_MATCHES) {
+            const start = Math.max(0, i - context_lines);
+            const end = Math.min(lines.length - 1, i + context_lines);
+            const contextLines = lines.slice(start, end + 1);
+
+            matches.push({
+              line_number: i + 1, // 1-indexed
+              context: contextLines.join('\n')
+            });
+          }
         }
       }
-      
+
       return {
         success: true,
         result: {
           document_id,
           query,
-          match_count: matches.length,
-          matches: matches.slice(0, 20) // Limit to 20 matches
+          match_count: matchCount,
+          matches
         }
       };
     } catch (err: any) {
@@ -22,62 +22,64 @@ const ALLOWED_ROOTS = [
   path.join(HOME_DIR, 'Downloads'),
 ];
 
+// Shortcut tokens mapped to their base directories. expandPath does a single
+// lookup on the first path segment instead of a chain of startsWith checks.
+const DOCUMENTS_DIR = path.join(HOME_DIR, 'Documents');
+const DOWNLOADS_DIR = path.join(HOME_DIR, 'Downloads');
+const PATH_SHORTCUTS: Record<string, string> = {
+  'desktop': DESKTOP_DIR,
+  'home screen': DESKTOP_DIR,
+  'homescreen': DESKTOP_DIR,
+  'documents': DOCUMENTS_DIR,
+  'my documents': DOCUMENTS_DIR,
+  'downloads': DOWNLOADS_DIR,
+  'home': HOME_DIR,
+  'home directory': HOME_DIR,
+};
+
 // Expand common path shortcuts
 function expandPath(inputPath: string): string {
   if (!inputPath) return inputPath;
-  
+
   // Normalize path separators to forward slashes for easier parsing
   const normalizedInput = inputPath.replace(/\\/g, '/');
-  const lowerPath = normalizedInput.toLowerCase();
-  
+
   // Expand ~ to home directory
   if (normalizedInput === '~' || normalizedInput.startsWith('~/')) {
-    return normalizedInput.replace(/^~/, HOME_DIR);
-  }
-  
-  // Expand paths starting with Desktop/
-  if (lowerPath === 'desktop' || lowerPath.startsWith('desktop/')) {
-    return normalizedInput.replace(/^desktop/i, DESKTOP_DIR);
-  }
-  
-  // Expand "home screen" variations
-  if (lowerPath === 'home screen' || lowerPath === 'homescreen' || 
-      lowerPath.startsWith('home screen/') || lowerPath.startsWith('homescreen/')) {
-    return normalizedInput.replace(/^home\s*screen/i, DESKTOP_DIR);
-  }
-  
-  // Expand paths starting with Documents/
-  if (lowerPath === 'documents' || lowerPath === 'my documents' || 
-      lowerPath.startsWith('documents/') || lowerPath.startsWith('my documents/')) {
-    const docsDir = path.join(HOME_DIR, 'Documents');
-    return normalizedInput.replace(/^(my\s*)?documents/i, docsDir);
-  }
-  
-  // Expand paths starting with Downloads/
-  if (lowerPath === 'downloads' || lowerPath.startsWith('downloads/')) {
-    const downloadsDir = path.join(HOME_DIR, 'Downloads');
-    return normalizedInput.replace(/^downloads/i, downloadsDir);
+    return HOME_DIR + normalizedInput.slice(1);
   }
-  
-  // Expand "home" to home directory
-  if (lowerPath === 'home' || lowerPath === 'home directory' ||
-      lowerPath.startsWith('home/')) {
-    return normalizedInput.replace(/^home(\s*directory)?/i, HOME_DIR);
+
+  // Expand shortcut prefixes (desktop, documents, home screen, ...) via a
+  // single lookup on the first path segment
+  const lowerPath = normalizedInput.toLowerCase();
+  const slash = normalizedInput.indexOf('/');
+  const firstSegment = slash === -1 ? lowerPath : lowerPath.slice(0, slash);
+  const shortcutBase = PATH_SHORTCUTS[firstSegment];
+  if (shortcutBase !== undefined) {
+    return slash === -1 ? shortcutBase : shortcutBase + normalizedInput.slice(slash);
   }
-  
+
   // If path doesn't start with drive letter or slash, treat as relative to Desktop
   if (!/^[a-zA-Z]:/.test(inputPath) && !inputPath.startsWith('/') && !inputPath.startsWith('\\')) {
     // Anything else without an absolute path goes to Desktop
     return path.join(DESKTOP_DIR, inputPath);
   }
-  
+
   return inputPath;
 }
 
+// The home root never changes at runtime, so resolve it once at module load
+// rather than re-normalizing it on every validation.
+const HOME_DIR_RESOLVED = HOME_DIR ? path.resolve(HOME_DIR) : HOME_DIR;
+// Prefix with a trailing separator so sibling directories that merely share
+// the home dir as a string prefix (e.g. /home/user2 vs /home/user) don't
+// pass the containment check.
+const HOME_DIR_PREFIX = HOME_DIR_RESOLVED ? HOME_DIR_RESOLVED + path.sep : '';
+
 function isPathAllowed(targetPath: string): boolean {
-  const resolved = path.resolve(targetPath);
-  // Allow any path under user's home directory
-  return resolved.startsWith(HOME_DIR);
+  // Callers pass an already-resolved path (validatePath resolves once);
+  // allow the home directory itself or any path below it.
+  return targetPath === HOME_DIR_RESOLVED || targetPath.startsWith(HOME_DIR_PREFIX);
 }
 
 function validatePath(targetPath: string): { valid: boolean; resolved: string; error?: string } {
@@ -269,28 +271,53 @@ export const getFileInfoDef: ToolDefinition = {
 
 // ============= TOOL HANDLERS =============
 
+// Repeated list_directory calls with the same arguments (agent retries,
+// quick refreshes) re-walk the directory every time. Cache successful
+// listings for a short window, keyed by resolved path + showHidden, and
+// drop the whole cache whenever this module mutates the filesystem. The
+// TTL keeps results honest against edits made outside the app.
+const LIST_CACHE_TTL_MS = 1500;
+const LIST_CACHE_MAX = 32;
+const listCache: Map<string, { expires: number; result: ToolResult }> = new Map();
+
+function invalidateListCache(): void {
+  listCache.clear();
+}
+
 export const listDirectoryHandler: ToolHandler = async (args, context): Promise<ToolResult> => {
   const validation = validatePath(args.path);
   if (!validation.valid) {
     return { success: false, error: validation.error };
   }
-  
+
+  const cacheKey = `${validation.resolved}|${args.showHidden ? 1 : 0}`;
+  const cached = listCache.get(cacheKey);
+  if (cached && cached.expires > Date.now()) {
+    return cached.result;
+  }
+
   try {
     const entries = await fsPromises.readdir(validation.resolved, { withFileTypes: true });
-    const results = [];
-    
-    for (const entry of entries) {
-      // Skip hidden files unless requested
-      if (!args.showHidden && entry.name.startsWith('.')) continue;
-      
+
+    // Stat all visible entries concurrently; awaiting each one in turn made
+    // listing a large directory pay full disk latency per entry. Entries
+    // that can't be stat'ed resolve to null and are skipped as before.
+    const visible = args.showHidden
+      ? entries
+      : entries.filter(entry => !entry.name.startsWith('.'));
+    const statted = await Promise.all(visible.map(async (entry) => {
       const fullPath = path.join(validation.resolved, entry.name);
-      let stats;
       try {
-        stats = await fsPromises.stat(fullPath);
+        return { entry, stats: await fsPromises.stat(fullPath) };
       } catch {
-        continue; // Skip files we can't stat
+        return null; // Skip files we can't stat
       }
-      
+    }));
+
+    const results = [];
+    for (const item of statted) {
+      if (!item) continue;
+      const { entry, stats } = item;
       results.push({
         name: entry.name,
         type: entry.isDirectory() ? 'directory' : 'file',
@@ -305,7 +332,7 @@ export const listDirectoryHandler: ToolHandler = async (args, context): Promise<
       return a.name.localeCompare(b.name);
     });
     
-    return {
+    const result: ToolResult = {
       success: true,
       result: {
         path: validation.resolved,
@@ -313,7 +340,36 @@ export const listDirectoryHandler: ToolHandler = async (args, context): Promise<
         entries: results
       }
     };
+    listCache.set(cacheKey, { expires: Date.now() + LIST_CACHE_TTL_MS, result });
+    if (listCache.size > LIST_CACHE_MAX) {
+      const oldest = listCache.keys().next().value;
+      if (oldest !== undefined) listCache.delete(oldest);
+    }
+    return result;
   } catch (err: any) {
+    // Callers that already know the exact file sometimes pass its path
+    // directly. Answer that with a single stat instead of an error — the
+    // degenerate "no wildcard" case needs no directory walk at all.
+    if (err.code === 'ENOTDIR') {
+      try {
+        const stats = await fsPromises.stat(validation.resolved);
+        return {
+          success: true,
+          result: {
+            path: validation.resolved,
+            count: 1,
+            entries: [{
+              name: path.basename(validation.resolved),
+              type: 'file',
+              size: stats.size,
+              modified: stats.mtime.toISOString(),
+            }]
+          }
+        };
+      } catch {
+        // fall through to the generic error below
+      }
+    }
     return { success: false, error: `Failed to list directory: ${err.message}` };
   }
 };
@@ -335,19 +391,29 @@ export const readFileHandler: ToolHandler = async (args, context): Promise<ToolR
       return { success: false, error: 'File is too large (max 5MB)' };
     }
     
-    const content = await fsPromises.readFile(validation.resolved, 'utf-8');
-    const lines = content.split('\n');
+    const raw = await fsPromises.readFile(validation.resolved);
     const maxLines = args.maxLines || 100;
-    
-    const truncated = lines.length > maxLines;
-    const resultLines = lines.slice(0, maxLines);
-    
+
+    // Scan the raw bytes for newlines (0x0A never occurs inside a UTF-8
+    // multibyte sequence) and find the truncation point in one pass, then
+    // decode only the bytes we keep. Decoding the whole file to a string
+    // first materialized the full content twice just to throw the tail away.
+    let totalLines = 1;
+    let cutIndex = -1;
+    let idx = -1;
+    while ((idx = raw.indexOf(0x0a, idx + 1)) !== -1) {
+      totalLines++;
+      if (totalLines === maxLines + 1) cutIndex = idx;
+    }
+
+    const truncated = totalLines > maxLines;
+
     return {
       success: true,
       result: {
         path: validation.resolved,
-        content: resultLines.join('\n'),
-        totalLines: lines.length,
+        content: truncated ? raw.toString('utf-8', 0, cutIndex) : raw.toString('utf-8'),
+        totalLines,
         truncated,
         size: stats.size
       }
@@ -393,6 +459,7 @@ export const createDirectoryHandler: ToolHandler = async (args, context): Promis
     }
     
     await fsPromises.mkdir(resolvedPath, { recursive: true });
+    invalidateListCache();
     return {
       success: true,
       result: { 
@@ -418,10 +485,10 @@ export const moveFileHandler: ToolHandler = async (args, context): Promise<ToolR
   }
   
   try {
-    // Check source exists
-    await fsPromises.access(sourceValidation.resolved);
-    
+    // rename itself reports a missing source (ENOENT), so probing with
+    // access() first just doubled the syscall cost of every move.
     await fsPromises.rename(sourceValidation.resolved, destValidation.resolved);
+    invalidateListCache();
     return {
       success: true,
       result: {
@@ -457,7 +524,8 @@ export const copyFileHandler: ToolHandler = async (args, context): Promise<ToolR
       await fsPromises.mkdir(path.dirname(destValidation.resolved), { recursive: true });
       await fsPromises.copyFile(sourceValidation.resolved, destValidation.resolved);
     }
-    
+
+    invalidateListCache();
     return {
       success: true,
       result: {
@@ -474,17 +542,17 @@ export const copyFileHandler: ToolHandler = async (args, context): Promise<ToolR
 async function copyDirectory(source: string, destination: string): Promise<void> {
   await fsPromises.mkdir(destination, { recursive: true });
   const entries = await fsPromises.readdir(source, { withFileTypes: true });
-  
-  for (const entry of entries) {
+
+  // Copy the entries of each directory concurrently instead of one awaited
+  // syscall at a time; file copies go through copyFile, which node backs
+  // with the kernel's copy_file_range where the platform supports it.
+  await Promise.all(entries.map((entry) => {
     const srcPath = path.join(source, entry.name);
     const destPath = path.join(destination, entry.name);
-    
-    if (entry.isDirectory()) {
-      await copyDirectory(srcPath, destPath);
-    } else {
-      await fsPromises.copyFile(srcPath, destPath);
-    }
-  }
+    return entry.isDirectory()
+      ? copyDirectory(srcPath, destPath)
+      : fsPromises.copyFile(srcPath, destPath);
+  }));
 }
 
 export const deleteFileHandler: ToolHandler = async (args, context): Promise<ToolResult> => {
@@ -505,7 +573,8 @@ export const deleteFileHandler: ToolHandler = async (args, context): Promise<Too
     } else {
       await fsPromises.unlink(validation.resolved);
     }
-    
+
+    invalidateListCache();
     return {
       success: true,
       result: { path: validation.resolved, message: 'Deleted successfully' }
@@ -524,20 +593,26 @@ export const writeFileHandler: ToolHandler = async (args, context): Promise<Tool
   try {
     // Ensure parent directory exists
     await fsPromises.mkdir(path.dirname(validation.resolved), { recursive: true });
-    
+
+    // Encode once up front: writing the string directly would utf8-encode it
+    // internally and the size report would then encode it all over again.
+    const data = Buffer.from(args.content, 'utf-8');
+
     if (args.append) {
-      await fsPromises.appendFile(validation.resolved, args.content, 'utf-8');
+      await fsPromises.appendFile(validation.resolved, data);
     } else {
-      await fsPromises.writeFile(validation.resolved, args.content, 'utf-8');
+      await fsPromises.writeFile(validation.resolved, data);
     }
-    
+
+    invalidateListCache();
+
     // Log successful write
     return {
       success: true,
       result: {
         path: validation.resolved,
         message: args.append ? 'Content appended successfully' : 'File written successfully',
-        size: Buffer.byteLength(args.content, 'utf-8')
+        size: data.length
       }
     };
   } catch (err: any) {
@@ -14,15 +14,11 @@ import {
   toOllamaTool,
   ToolCall
 } from './types';
-import { fileSystemTools } from './filesystem';
-import { assertPermission } from '../config-manager';
-import { systemToolDefs, systemToolHandlers } from './system';
-import { webToolDefs, webToolHandlers } from './web';
-import { voiceToolDefs, voiceToolHandlers } from './voice';
-import { memoryToolDefs, memoryToolHandlers } from './memory';
-import { documentToolDefs, documentToolHandlers } from './documents';
-import { nbaQueryDef, nbaQueryHandler } from './nba';
-import sports from './sports';
+import { assertPermission, getSettings } from '../config-manager';
+
+// Tool modules are required lazily in `initializeTools()` so importing the
+// registry (and its executors) does not pull in every tool implementation and
+// their transitive dependencies at module load.
 
 // Global tool registry
 const toolRegistry = new Map<string, RegisteredTool>();
@@ -45,6 +41,7 @@ const pendingConfirmations = new Map<string, {
  */
 export function registerTool(name: string, definition: ToolDefinition, handler: ToolHandler): void {
   toolRegistry.set(name, { definition, handler });
+  ollamaToolsCache = null;
   console.log(`[SADIE Tools] Registered tool: ${name}`);
 }
 
@@ -55,11 +52,18 @@ export function getAllToolDefinitions(): ToolDefinition[] {
   return Array.from(toolRegistry.values()).map(t => t.definition);
 }
 
+// The Ollama projection of the registry only changes when a tool is
+// registered; cache it instead of rebuilding the array on every request.
+let ollamaToolsCache: OllamaTool[] | null = null;
+
 /**
  * Get tool definitions in Ollama format
  */
 export function getOllamaTools(): OllamaTool[] {
-  return getAllToolDefinitions().map(toOllamaTool);
+  if (!ollamaToolsCache) {
+    ollamaToolsCache = getAllToolDefinitions().map(toOllamaTool);
+  }
+  return ollamaToolsCache;
 }
 
 /**
@@ -175,7 +179,11 @@ export async function executeToolBatch(
   try { (global as any).__SADIE_ROUTER_LOG_BUFFER = (global as any).__SADIE_ROUTER_LOG_BUFFER || []; } catch (e) {}
   console.log('[BATCH] executeToolBatch called', { toolCount: calls.length, toolNames: calls.map(c => c.name) });
   try { (global as any).__SADIE_ROUTER_LOG_BUFFER.push(`[BATCH] called tools=${calls.map(c=>c.name).join(',')}`); } catch (e) {}
-  // Pre-check permissions for all unique tools
+  // Pre-check permissions for all unique tools. Enablement cannot change
+  // mid-precheck, so snapshot the settings once for the whole batch instead
+  // of fetching them for every tool and declared permission.
+  let settingsSnapshot: any;
+  try { settingsSnapshot = getSettings(); } catch (e) { settingsSnapshot = undefined; }
   const denied: string[] = [];
   const seen = new Set<string>();
   const overrides = new Set(options?.overrideAllowed || []);
@@ -185,7 +193,7 @@ export async function executeToolBatch(
     seen.add(name);
     try {
       if (overrides.has(name)) continue;
-      const allowed = assertPermission(name);
+      const allowed = assertPermission(name, settingsSnapshot);
       console.log(`[SADIE Tools] Permission check for ${name}: allowed=${allowed}`);
       try { (global as any).__SADIE_ROUTER_LOG_BUFFER?.push(`[TOOLS] permission-check ${name}=${allowed}`); } catch (e) {}
       if (!allowed) denied.push(name);
@@ -196,7 +204,7 @@ export async function executeToolBatch(
         if (tool && Array.isArray((tool.definition as any).requiredPermissions)) {
           for (const perm of (tool.definition as any).requiredPermissions as string[]) {
             if (overrides.has(perm)) continue;
-            const pAllowed = assertPermission(perm);
+            const pAllowed = assertPermission(perm, settingsSnapshot);
             console.log(`[SADIE Tools] Permission check for declared permission ${perm}: allowed=${pAllowed}`);
             try { (global as any).__SADIE_ROUTER_LOG_BUFFER?.push(`[TOOLS] permission-check ${perm}=${pAllowed}`); } catch (e) {}
             if (!pAllowed) denied.push(perm);
@@ -218,31 +226,45 @@ export async function executeToolBatch(
     return [{ success: false, status: 'needs_confirmation', missingPermissions: denied, reason: `Requires permissions: ${denied.join(', ')}` } as any];
   }
 
-  const results: ToolResult[] = [];
-  for (const call of calls) {
-    // Prepare execution context including any transient overrides
-    const callContext = { ...(context || {} as any), overrideAllowed: Array.from(overrides) } as any;
+  // The execution context (including transient overrides) is identical for
+  // every call in the batch, so build it once instead of spreading per call.
+  const callContext = { ...(context || {} as any), overrideAllowed: Array.from(overrides) } as any;
+
+  async function runCall(call: ToolCall): Promise<ToolResult> {
     // If this call is explicitly overridden, call the handler directly (so tools can honor overrideAllowed)
     if (overrides.has(call.name)) {
       const tool = getTool(call.name);
       if (!tool) {
-        results.push({ success: false, error: `Unknown tool: ${call.name}` });
-        continue;
+        return { success: false, error: `Unknown tool: ${call.name}` };
       }
       try {
-        const r = await tool.handler(call.arguments, callContext);
-        results.push(r);
+        return await tool.handler(call.arguments, callContext);
       } catch (e: any) {
-        results.push({ success: false, error: `Tool execution failed: ${e?.message || String(e)}` });
+        return { success: false, error: `Tool execution failed: ${e?.message || String(e)}` };
       }
-      continue;
     }
 
-    const result = await executeTool(call, callContext);
-    results.push(result);
+    return executeTool(call, callContext);
   }
 
-  return results;
+  // Permissions were verified up front, so independent (mostly I/O-bound)
+  // calls can run concurrently — wall-clock time becomes roughly the slowest
+  // call instead of the sum. Calls that may prompt the user for confirmation
+  // stay serial so dialogs never overlap.
+  const needsSerial = calls.some((call) => {
+    const tool = getTool(call.name);
+    return !!(tool?.definition.requiresConfirmation && context?.requestConfirmation);
+  });
+
+  if (needsSerial || calls.length <= 1) {
+    const results: ToolResult[] = [];
+    for (const call of calls) {
+      results.push(await runCall(call));
+    }
+    return results;
+  }
+
+  return Promise.all(calls.map((call) => runCall(call)));
 }
 
 /**
@@ -307,6 +329,17 @@ export function respondToConfirmation(confirmId: string, confirmed: boolean): bo
  * Initialize all built-in tools
  */
 export function initializeTools(): void {
+  // Load tool modules on demand — each require() below is what actually pays
+  // the import cost, so callers that never initialize tools skip it entirely.
+  const { fileSystemTools } = require('./filesystem');
+  const { systemToolDefs, systemToolHandlers } = require('./system');
+  const { webToolDefs, webToolHandlers } = require('./web');
+  const { voiceToolDefs, voiceToolHandlers } = require('./voice');
+  const { memoryToolDefs, memoryToolHandlers } = require('./memory');
+  const { documentToolDefs, documentToolHandlers } = require('./documents');
+  const { nbaQueryDef, nbaQueryHandler } = require('./nba');
+  const sports = require('./sports').default;
+
   // Register file system tools
   for (const [name, tool] of Object.entries(fileSystemTools)) {
     registerTool(name, tool.definition, tool.handler);
@@ -7,6 +7,7 @@
 
 import { ToolDefinition, ToolHandler, ToolResult } from './types';
 import axios from 'axios';
+import { keepAliveAgents } from '../http-agents';
 
 const QDRANT_URL = process.env.QDRANT_URL || 'http://localhost:6333';
 const OLLAMA_URL = process.env.OLLAMA_URL || 'http://localhost:11434';
@@ -15,14 +16,33 @@ const EMBEDDING_MODEL = 'nomic-embed-text';
 
 // ============= HELPER FUNCTIONS =============
 
+// Embeddings are deterministic per (model, text), so repeated lookups of the
+// same content — recall queries fire on many chat turns — can skip the
+// Ollama round trip entirely. Small LRU keyed by the input text.
+const EMBEDDING_CACHE_MAX = 200;
+const embeddingCache: Map<string, number[]> = new Map();
+
 // Get embedding from Ollama
 async function getEmbedding(text: string): Promise<number[]> {
+  const cached = embeddingCache.get(text);
+  if (cached) {
+    // Re-insert to refresh recency so hot queries stay resident
+    embeddingCache.delete(text);
+    embeddingCache.set(text, cached);
+    return cached;
+  }
   try {
     const response = await axios.post(`${OLLAMA_URL}/api/embeddings`, {
       model: EMBEDDING_MODEL,
       prompt: text
-    });
-    return response.data.embedding;
+    }, keepAliveAgents);
+    const embedding = response.data.embedding;
+    embeddingCache.set(text, embedding);
+    if (embeddingCache.size > EMBEDDING_CACHE_MAX) {
+      const oldest = embeddingCache.keys().next().value;
+      if (oldest !== undefined) embeddingCache.delete(oldest);
+    }
+    return embedding;
   } catch (error: any) {
     console.error('Failed to get embedding:', error.message);
     throw new Error(`Embedding failed: ${error.message}`);
@@ -33,7 +53,7 @@ async function getEmbedding(text: string): Promise<number[]> {
 async function ensureCollection(): Promise<void> {
   try {
     // Check if collection exists
-    const response = await axios.get(`${QDRANT_URL}/collections/${COLLECTION_NAME}`);
+    const response = await axios.get(`${QDRANT_URL}/collections/${COLLECTION_NAME}`, keepAliveAgents);
     if (response.status === 200) return;
   } catch (error: any) {
     if (error.response?.status === 404) {
@@ -43,7 +63,7 @@ async function ensureCollection(): Promise<void> {
           size: 768,
           distance: 'Cosine'
         }
-      });
+      }, keepAliveAgents);
       console.log('[Memory] Created Qdrant collection:', COLLECTION_NAME);
     } else {
       throw error;
@@ -163,7 +183,7 @@ export const rememberHandler: ToolHandler = async (args): Promise<ToolResult> =>
           createdAt: new Date().toISOString()
         }
       }]
-    });
+    }, keepAliveAgents);
 
     return {
       success: true,
@@ -200,7 +220,7 @@ export const recallHandler: ToolHandler = async (args): Promise<ToolResult> => {
       limit: limit,
       with_payload: true,
       score_threshold: 0.5  // Only return reasonably relevant results
-    });
+    }, keepAliveAgents);
 
     const memories = response.data.result.map((hit: any) => ({
       id: hit.id,
@@ -243,7 +263,7 @@ export const forgetHandler: ToolHandler = async (args): Promise<ToolResult> => {
     // Delete from Qdrant
     await axios.post(`${QDRANT_URL}/collections/${COLLECTION_NAME}/points/delete`, {
       points: [memoryId]
-    });
+    }, keepAliveAgents);
 
     return {
       success: true,
@@ -278,7 +298,7 @@ export const listMemoriesHandler: ToolHandler = async (args): Promise<ToolResult
       limit: limit,
       with_payload: true,
       filter: filter
-    });
+    }, keepAliveAgents);
 
     const memories = response.data.result.points.map((point: any) => ({
       id: point.id,
@@ -8,6 +8,8 @@ import { ToolDefinition, ToolHandler, ToolResult } from './types';
 import * as https from 'https';
 import * as zlib from 'zlib';
 import { URL } from 'url';
+import { isE2E } from '../env';
+import { keepAliveHttpsAgent } from '../http-agents';
 
 export const nbaQueryDef: ToolDefinition = {
   name: 'nba_query',
@@ -40,14 +42,22 @@ export const nbaQueryDef: ToolDefinition = {
   }
 };
 
+// Shared header template; spread per-call headers over a copy instead of
+// rebuilding the base set on every request.
+const BASE_HTTP_HEADERS = Object.freeze({
+  'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) SADIE/1.0',
+  'Accept': 'application/json,text/html;q=0.9,*/*;q=0.8',
+  'Accept-Encoding': 'gzip, deflate, br'
+});
+
 function httpsGet(url: string, headers: Record<string, string> = {}): Promise<any> {
   return new Promise((resolve, reject) => {
-    const options = { headers: {
-      'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) SADIE/1.0',
-      'Accept': 'application/json,text/html;q=0.9,*/*;q=0.8',
-      'Accept-Encoding': 'gzip, deflate, br',
-      ...headers
-    }};
+    const options = {
+      // Reuse pooled sockets so back-to-back ESPN calls skip the TCP/TLS
+      // handshake (roster lookups fan out to ~30 requests per query).
+      agent: keepAliveHttpsAgent,
+      headers: { ...BASE_HTTP_HEADERS, ...headers }
+    };
     https.get(url, options as any, res => {
       const chunks: Buffer[] = [];
       const encoding = (res.headers['content-encoding'] || '').toLowerCase();
@@ -74,6 +84,32 @@ function httpsGet(url: string, headers: Record<string, string> = {}): Promise<an
   });
 }
 
+// ============= SIMPLE IN-MEMORY CACHE =============
+// Mirrors the web tools cache: ESPN responses repeat constantly within a
+// session (the teams list alone backs team, roster and player lookups), so
+// cache GETs by URL. Live data (scoreboard, news) gets a short TTL; the
+// teams list rarely changes and keeps a longer one.
+type CacheEntry = { data: any; expires: number };
+const LIVE_TTL_MS = 60 * 1000; // 1 minute
+const TEAMS_TTL_MS = 10 * 60 * 1000; // 10 minutes
+const espnCache: Map<string, CacheEntry> = new Map();
+
+function getFromCache(key: string): any | null {
+  if (isE2E) return null;
+  const entry = espnCache.get(key);
+  if (!entry) return null;
+  if (Date.now() > entry.expires) {
+    espnCache.delete(key);
+    return null;
+  }
+  return entry.data;
+}
+
+function setCache(key: string, data: any, ttlMs: number) {
+  if (isE2E) return;
+  espnCache.set(key, { data, expires: Date.now() + ttlMs });
+}
+
 // ESPN helpers
 async function fetchEspnJson(path: string, params: Record<string, string | number> = {}) {
   const base = 'https://site.api.espn.com/apis/site/v2/sports/basketball/nba';
@@ -81,7 +117,12 @@ async function fetchEspnJson(path: string, params: Record<string, string | numbe
   for (const [k, v] of Object.entries(params)) {
     if (v !== undefined && v !== null && v !== '') url.searchParams.set(k, String(v));
   }
-  return await httpsGet(url.toString());
+  const urlStr = url.toString();
+  const cached = getFromCache(urlStr);
+  if (cached !== null) return cached;
+  const data = await httpsGet(urlStr);
+  setCache(urlStr, data, path === '/teams' ? TEAMS_TTL_MS : LIVE_TTL_MS);
+  return data;
 }
 
 async function findTeamByQuery(query: string) {
@@ -98,130 +139,159 @@ async function findTeamByQuery(query: string) {
 }
 
 async function findPlayerByName(query: string, perPage = 20) {
-  // Try to find player by scanning rosters for a matching displayName
+  // Try to find player by scanning rosters for a matching displayName. The
+  // per-team roster fetches are independent, so issue them concurrently
+  // instead of paying ~30 round trips one at a time.
   const teamsResp = await fetchEspnJson('/teams');
   const allTeams = (teamsResp.sports?.[0]?.leagues?.[0]?.teams || []).map((t: any) => t.team);
   const q = query.toLowerCase();
-  const found: any[] = [];
-  for (const t of allTeams) {
+  const rosters = await Promise.all(allTeams.map(async (t: any) => {
     try {
       const roster = await fetchEspnJson(`/teams/${t.id}/roster`, { limit: perPage });
-      const players = roster?.athletes || roster?.roster || roster?.items || [];
-      for (const p of players) {
-        const name = (p.displayName || p.fullName || '').toLowerCase();
-        if (name.includes(q)) {
-          found.push({ player: p, team: t });
-          if (found.length >= perPage) break;
-        }
+      return { team: t, players: roster?.athletes || roster?.roster || roster?.items || [] };
+    } catch {
+      return { team: t, players: [] };
+    }
+  }));
+
+  const found: any[] = [];
+  for (const { team, players } of rosters) {
+    for (const p of players) {
+      const name = (p.displayName || p.fullName || '').toLowerCase();
+      if (name.includes(q)) {
+        found.push({ player: p, team });
+        if (found.length >= perPage) return found;
       }
-      if (found.length >= perPage) break;
-    } catch {}
+    }
   }
   return found;
 }
 
-export const nbaQueryHandler: ToolHandler = async (args): Promise<ToolResult> => {
-  try {
-    const type = args.type;
-    const query = args.query || '';
-    const date = args.date || '';
-    const perPage = Math.min(Math.max(1, args.perPage || 5), 25);
-    // Use ESPN endpoints for news/games/teams/roster/players when possible
-    if (type === 'news') {
-      // General NBA news or filtered by query
-      const params: any = { limit: perPage };
-      const news = await fetchEspnJson('/news', params);
-      let items = news?.articles || news?.items || [];
-      if (query) {
-        const q = query.toLowerCase();
-        items = items.filter((it: any) => (it?.headline || it?.title || '').toLowerCase().includes(q) || (it?.summary || '').toLowerCase().includes(q));
-      }
-      return { success: true, result: { query, resultCount: items.length, articles: items.slice(0, perPage) } };
-    }
+// Per-type query context shared by the dispatch handlers below
+type NbaQueryContext = { query: string; date: string; perPage: number };
 
-    if (type === 'games') {
-      // Use ESPN scoreboard; date format: YYYYMMDD (or YYYY-MM-DD)
-      const d = (date || '').replace(/-/g, '');
-      const params: any = {};
-      if (d) params.dates = d;
-      const board = await fetchEspnJson('/scoreboard', params);
-      let events = board?.events || [];
-
-      // If no events found for the requested date/range, fall back to a
-      // rolling 7-day window to avoid week-boundary and timezone issues.
-      // If events empty and either no date was given, or the date token is a
-      // fuzzy phrase like 'this week' / 'last week', fall back to a rolling
-      // 7-day window to be tolerant of week-boundaries and timezone shifts.
-      if ((!events || events.length === 0) && (!d || /week|last/i.test(d))) {
-        const seen = new Set<string>();
-        const agg: any[] = [];
-        const now = new Date();
-        for (let i = 0; i < 7; i++) {
-          const dt = new Date(now);
-          dt.setDate(now.getDate() - i);
-          const y = dt.getFullYear();
-          const m = String(dt.getMonth() + 1).padStart(2, '0');
-          const day = String(dt.getDate()).padStart(2, '0');
-          const dateParam = `${y}${m}${day}`;
-          try {
-            const b = await fetchEspnJson('/scoreboard', { dates: dateParam });
-            const ev = b?.events || [];
-            for (const e of ev) {
-              const id = e?.id || JSON.stringify(e);
-              if (!seen.has(id)) { seen.add(id); agg.push(e); }
-            }
-          } catch (e) { /* ignore individual date fetch errors */ }
-        }
-        events = agg;
-      }
-      if (query) {
-        const q = query.toLowerCase();
-        events = events.filter((e: any) => (e.name || '').toLowerCase().includes(q) || (e.shortName || '').toLowerCase().includes(q) || (e.competitions || []).some((c: any) => (c.competitors || []).some((co: any) => (co.team?.displayName || '').toLowerCase().includes(q))));
+async function queryNews({ query, perPage }: NbaQueryContext): Promise<ToolResult> {
+  // General NBA news or filtered by query
+  const params: any = { limit: perPage };
+  const news = await fetchEspnJson('/news', params);
+  let items = news?.articles || news?.items || [];
+  if (query) {
+    const q = query.toLowerCase();
+    items = items.filter((it: any) => (it?.headline || it?.title || '').toLowerCase().includes(q) || (it?.summary || '').toLowerCase().includes(q));
+  }
+  return { success: true, result: { query, resultCount: items.length, articles: items.slice(0, perPage) } };
+}
+
+async function queryGames({ query, date }: NbaQueryContext): Promise<ToolResult> {
+  // Use ESPN scoreboard; date format: YYYYMMDD (or YYYY-MM-DD)
+  const d = (date || '').replace(/-/g, '');
+  const params: any = {};
+  if (d) params.dates = d;
+  const board = await fetchEspnJson('/scoreboard', params);
+  let events = board?.events || [];
+
+  // If no events found for the requested date/range, fall back to a
+  // rolling 7-day window to avoid week-boundary and timezone issues.
+  // If events empty and either no date was given, or the date token is a
+  // fuzzy phrase like 'this week' / 'last week', fall back to a rolling
+  // 7-day window to be tolerant of week-boundaries and timezone shifts.
+  if ((!events || events.length === 0) && (!d || /week|last/i.test(d))) {
+    const now = new Date();
+    const dates: string[] = [];
+    for (let i = 0; i < 7; i++) {
+      const dt = new Date(now);
+      dt.setDate(now.getDate() - i);
+      const y = dt.getFullYear();
+      const m = String(dt.getMonth() + 1).padStart(2, '0');
+      const day = String(dt.getDate()).padStart(2, '0');
+      dates.push(`${y}${m}${day}`);
+    }
+    // Fetch all seven scoreboards concurrently; ignore individual date
+    // fetch errors. De-dup preserves newest-first date order.
+    const boards = await Promise.all(dates.map(dateParam =>
+      fetchEspnJson('/scoreboard', { dates: dateParam }).catch(() => null)
+    ));
+    const seen = new Set<string>();
+    const agg: any[] = [];
+    for (const b of boards) {
+      const ev = b?.events || [];
+      for (const e of ev) {
+        const id = e?.id || JSON.stringify(e);
+        if (!seen.has(id)) { seen.add(id); agg.push(e); }
       }
-      return { success: true, result: { query, resultCount: events.length, events } };
     }
+    events = agg;
+  }
+  if (query) {
+    const q = query.toLowerCase();
+    events = events.filter((e: any) => (e.name || '').toLowerCase().includes(q) || (e.shortName || '').toLowerCase().includes(q) || (e.competitions || []).some((c: any) => (c.competitors || []).some((co: any) => (co.team?.displayName || '').toLowerCase().includes(q))));
+  }
+  return { success: true, result: { query, resultCount: events.length, events } };
+}
 
-    if (type === 'teams') {
-      const teams = await fetchEspnJson('/teams');
-      const allTeams = (teams.sports?.[0]?.leagues?.[0]?.teams || []).map((t: any) => t.team);
-      return { success: true, result: { query, resultCount: allTeams.length, teams: allTeams } };
-    }
+async function queryTeams({ query }: NbaQueryContext): Promise<ToolResult> {
+  const teams = await fetchEspnJson('/teams');
+  const allTeams = (teams.sports?.[0]?.leagues?.[0]?.teams || []).map((t: any) => t.team);
+  return { success: true, result: { query, resultCount: allTeams.length, teams: allTeams } };
+}
 
-    if (type === 'roster') {
-      // find team by query, then fetch roster
-      if (!query) return { success: false, error: 'roster type requires query (team name, slug or abbreviation)' };
-      const found = await findTeamByQuery(query);
-      if (!found) return { success: false, error: `Team not found: ${query}` };
-      const path = `/teams/${found.id}/roster`;
-      const roster = await fetchEspnJson(path, { limit: perPage });
-      const entries = roster?.athletes || roster?.roster || roster?.items || [];
-      return { success: true, result: { team: found, roster: entries } };
-    }
+async function queryRoster({ query, perPage }: NbaQueryContext): Promise<ToolResult> {
+  // find team by query, then fetch roster
+  if (!query) return { success: false, error: 'roster type requires query (team name, slug or abbreviation)' };
+  const found = await findTeamByQuery(query);
+  if (!found) return { success: false, error: `Team not found: ${query}` };
+  const path = `/teams/${found.id}/roster`;
+  const roster = await fetchEspnJson(path, { limit: perPage });
+  const entries = roster?.athletes || roster?.roster || roster?.items || [];
+  return { success: true, result: { team: found, roster: entries } };
+}
 
-    if (type === 'players') {
-      // Attempt to find player by name via ESPN team rosters
-      const found = await findPlayerByName(query, perPage);
-      if (found && found.length > 0) {
-        return { success: true, result: { query, resultCount: found.length, players: found } };
-      }
+async function queryPlayers({ query, perPage }: NbaQueryContext): Promise<ToolResult> {
+  // Attempt to find player by name via ESPN team rosters
+  const found = await findPlayerByName(query, perPage);
+  if (found && found.length > 0) {
+    return { success: true, result: { query, resultCount: found.length, players: found } };
+  }
 
-      // Fallback to balldontlie if API key provided
-      const balKey = process.env.BALDONTLIE_API_KEY || process.env.BALDONTLIE_KEY;
-      if (balKey) {
-        const url = `https://api.balldontlie.io/v1/players?per_page=${perPage}&search=${encodeURIComponent(query)}`;
-        const result = await httpsGet(url, { Authorization: `Bearer ${balKey}` });
-        return { success: true, result };
-      }
+  // Fallback to balldontlie if API key provided
+  const balKey = process.env.BALDONTLIE_API_KEY || process.env.BALDONTLIE_KEY;
+  if (balKey) {
+    const url = `https://api.balldontlie.io/v1/players?per_page=${perPage}&search=${encodeURIComponent(query)}`;
+    const result = await httpsGet(url, { Authorization: `Bearer ${balKey}` });
+    return { success: true, result };
+  }
 
-      return { success: true, result: { query, resultCount: 0, players: [] } };
-    }
+  return { success: true, result: { query, resultCount: 0, players: [] } };
+}
 
-    // Stats not implemented in ESPN tool (could be added later)
-    if (type === 'stats') {
-      return { success: false, error: 'Stats queries not implemented. Use players/games/roster/news.' };
-    }
+async function queryStats(_ctx: NbaQueryContext): Promise<ToolResult> {
+  // Stats not implemented in ESPN tool (could be added later)
+  return { success: false, error: 'Stats queries not implemented. Use players/games/roster/news.' };
+}
 
-    return { success: false, error: 'Invalid type. Use games, teams, players, roster, or news.' };
+// Dispatch on type via one table lookup rather than walking an if-chain of
+// string comparisons per call.
+const NBA_QUERY_HANDLERS: Record<string, (ctx: NbaQueryContext) => Promise<ToolResult>> = {
+  news: queryNews,
+  games: queryGames,
+  teams: queryTeams,
+  roster: queryRoster,
+  players: queryPlayers,
+  stats: queryStats,
+};
+
+export const nbaQueryHandler: ToolHandler = async (args): Promise<ToolResult> => {
+  try {
+    const type = args.type;
+    const query = args.query || '';
+    const date = args.date || '';
+    const perPage = Math.min(Math.max(1, args.perPage || 5), 25);
+    // Use ESPN endpoints for news/games/teams/roster/players when possible
+    const handler = NBA_QUERY_HANDLERS[type];
+    if (!handler) {
+      return { success: false, error: 'Invalid type. Use games, teams, players, roster, or news.' };
+    }
+    return await handler({ query, date, perPage });
   } catch (err: any) {
     return { success: false, error: `NBA query failed: ${err.message}` };
   }
@@ -5,6 +5,8 @@
  */
 
 import * as os from 'os';
+import * as fs from 'fs';
+import * as path from 'path';
 import { exec } from 'child_process';
 import { promisify } from 'util';
 import { ToolDefinition, ToolHandler, ToolResult } from './types';
@@ -453,10 +455,12 @@ export const calculateHandler: ToolHandler = async (args): Promise<ToolResult> =
 
 export const screenshotHandler: ToolHandler = async (args): Promise<ToolResult> => {
   try {
+    // electron stays a lazy require so this module loads outside the
+    // Electron runtime (e.g. under jest); fs/path/os are plain node modules
+    // and are imported once at the top instead of per call.
     const { screen, desktopCapturer } = require('electron');
-    const fs = require('fs');
-    const path = require('path');
-    
+
+
     // Get the primary display
     const primaryDisplay = screen.getPrimaryDisplay();
     const { width, height } = primaryDisplay.size;
@@ -483,18 +487,16 @@ export const screenshotHandler: ToolHandler = async (args): Promise<ToolResult>
     const filename = args.filename || `screenshot-${timestamp}`;
     
     // Save to Pictures folder
-    const picturesDir = path.join(require('os').homedir(), 'Pictures', 'SADIE Screenshots');
-    
-    // Create directory if it doesn't exist
-    if (!fs.existsSync(picturesDir)) {
-      fs.mkdirSync(picturesDir, { recursive: true });
-    }
-    
+    const picturesDir = path.join(os.homedir(), 'Pictures', 'SADIE Screenshots');
     const filepath = path.join(picturesDir, `${filename}.png`);
-    
-    // Save the image
+
+    // Write asynchronously: a full-screen PNG runs to several MB and the
+    // synchronous write stalled the main process (and every pending IPC
+    // message) for the duration. recursive mkdir is a no-op when the
+    // directory already exists, so no exists check is needed.
     const pngBuffer = thumbnail.toPNG();
-    fs.writeFileSync(filepath, pngBuffer);
+    await fs.promises.mkdir(picturesDir, { recursive: true });
+    await fs.promises.writeFile(filepath, pngBuffer);
     
     return {
       success: true,
@@ -510,49 +512,47 @@ export const screenshotHandler: ToolHandler = async (args): Promise<ToolResult>
   }
 };
 
+// Creating an Intl formatter is far more expensive than using one, and each
+// toLocaleDateString/toLocaleTimeString call with an options object builds a
+// fresh formatter internally. Build the two formatters once at module load.
+const DATE_FORMATTER = new Intl.DateTimeFormat('en-US', {
+  weekday: 'long',
+  year: 'numeric',
+  month: 'long',
+  day: 'numeric'
+});
+const TIME_FORMATTER = new Intl.DateTimeFormat('en-US', {
+  hour: '2-digit',
+  minute: '2-digit',
+  second: '2-digit'
+});
+const LOCAL_TIMEZONE = Intl.DateTimeFormat().resolvedOptions().timeZone;
+
 export const getCurrentTimeHandler: ToolHandler = async (args): Promise<ToolResult> => {
   try {
     const format = args.format || 'full';
     const now = new Date();
-    
+
     let result: any = { timestamp: now.getTime() };
-    
+
     switch (format) {
       case 'date':
-        result.date = now.toLocaleDateString('en-US', { 
-          weekday: 'long', 
-          year: 'numeric', 
-          month: 'long', 
-          day: 'numeric' 
-        });
+        result.date = DATE_FORMATTER.format(now);
         break;
       case 'time':
-        result.time = now.toLocaleTimeString('en-US', { 
-          hour: '2-digit', 
-          minute: '2-digit', 
-          second: '2-digit' 
-        });
+        result.time = TIME_FORMATTER.format(now);
         break;
       case 'iso':
         result.iso = now.toISOString();
         break;
       case 'full':
       default:
-        result.date = now.toLocaleDateString('en-US', { 
-          weekday: 'long', 
-          year: 'numeric', 
-          month: 'long', 
-          day: 'numeric' 
-        });
-        result.time = now.toLocaleTimeString('en-US', { 
-          hour: '2-digit', 
-          minute: '2-digit', 
-          second: '2-digit' 
-        });
-        result.timezone = Intl.DateTimeFormat().resolvedOptions().timeZone;
+        result.date = DATE_FORMATTER.format(now);
+        result.time = TIME_FORMATTER.format(now);
+        result.timezone = LOCAL_TIMEZONE;
         break;
     }
-    
+
     return { success: true, result };
   } catch (err: any) {
     return { success: false, error: `Failed to get time: ${err.message}` };
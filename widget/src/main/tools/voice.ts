@@ -104,15 +104,23 @@ export const speakHandler: ToolHandler = async (args): Promise<ToolResult> => {
           utterance.pitch = ${pitch};
           utterance.volume = ${volume};
           
-          // Try to use a good English voice
-          const voices = window.speechSynthesis.getVoices();
-          const preferredVoice = voices.find(v => 
-            v.name.includes('Microsoft Zira') || 
-            v.name.includes('Microsoft David') ||
-            v.name.includes('Google') ||
-            (v.lang.startsWith('en') && v.localService)
-          ) || voices.find(v => v.lang.startsWith('en')) || voices[0];
-          
+          // Try to use a good English voice. The installed voice set does
+          // not change between calls, so resolve the preference once and
+          // reuse it for every subsequent utterance.
+          let preferredVoice = window.__sadiePreferredVoice;
+          if (!preferredVoice) {
+            const voices = window.speechSynthesis.getVoices();
+            preferredVoice = voices.find(v =>
+              v.name.includes('Microsoft Zira') ||
+              v.name.includes('Microsoft David') ||
+              v.name.includes('Google') ||
+              (v.lang.startsWith('en') && v.localService)
+            ) || voices.find(v => v.lang.startsWith('en')) || voices[0];
+            if (preferredVoice) {
+              window.__sadiePreferredVoice = preferredVoice;
+            }
+          }
+
           if (preferredVoice) {
             utterance.voice = preferredVoice;
           }
@@ -176,24 +184,31 @@ export const getVoicesHandler: ToolHandler = async (): Promise<ToolResult> => {
       return { success: false, error: 'No window available' };
     }
 
-    const voices = await mainWindow.webContents.executeJavaScript(`
+    // Apply the 20-voice cap inside the renderer so only the entries we
+    // actually report get serialized back over the executeJavaScript
+    // boundary; systems routinely install 100+ voices.
+    const report = await mainWindow.webContents.executeJavaScript(`
       (function() {
         if (!window.speechSynthesis) {
-          return [];
+          return { count: 0, voices: [] };
         }
-        return window.speechSynthesis.getVoices().map(v => ({
-          name: v.name,
-          lang: v.lang,
-          local: v.localService
-        }));
+        const all = window.speechSynthesis.getVoices();
+        return {
+          count: all.length,
+          voices: all.slice(0, 20).map(v => ({
+            name: v.name,
+            lang: v.lang,
+            local: v.localService
+          }))
+        };
       })()
     `);
 
     return {
       success: true,
       result: {
-        count: voices.length,
-        voices: voices.slice(0, 20) // Limit to 20 voices
+        count: report.count,
+        voices: report.voices
       }
     };
   } catch (err: any) {
@@ -11,6 +11,7 @@ import * as http from 'http';
 import * as dns from 'dns';
 import * as net from 'net';
 import { isE2E } from '../env';
+import { keepAliveHttpAgent, keepAliveHttpsAgent } from '../http-agents';
 
 // ============= TOOL DEFINITIONS =============
 
@@ -79,6 +80,15 @@ export const getWeatherDef: ToolDefinition = {
 
 // ============= HELPER FUNCTIONS =============
 
+// Base header template shared by every request; per-call headers are spread
+// over a copy instead of rebuilding the full set each time.
+const BASE_HTTP_HEADERS = Object.freeze({
+  // Use a browser-like User-Agent - DuckDuckGo blocks bot-like agents
+  'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+  'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+  'Accept-Language': 'en-US,en;q=0.5'
+});
+
 function httpGet(url: string, headers: Record<string, string> = {}): Promise<string> {
   return new Promise(async (resolve, reject) => {
     // Validate the URL before attempting any network request to mitigate SSRF/local access
@@ -94,13 +104,10 @@ function httpGet(url: string, headers: Record<string, string> = {}): Promise<str
     const client = isHttps ? https : http;
     
     const options = {
-      headers: {
-        // Use a browser-like User-Agent - DuckDuckGo blocks bot-like agents
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        ...headers
-      }
+      // Keep-alive pooling: a search followed by fetching the top results
+      // hits the same hosts repeatedly, so reuse sockets across requests.
+      agent: isHttps ? keepAliveHttpsAgent : keepAliveHttpAgent,
+      headers: { ...BASE_HTTP_HEADERS, ...headers }
     };
     
     const req = client.get(url, options, (res) => {
@@ -117,10 +124,12 @@ function httpGet(url: string, headers: Record<string, string> = {}): Promise<str
         return;
       }
       
-      let data = '';
-      res.setEncoding('utf8');
-      res.on('data', chunk => data += chunk);
-      res.on('end', () => resolve(data));
+      // Collect raw Buffer chunks and decode once at the end (matching the
+      // NBA tool's httpsGet): repeated string concatenation re-copies the
+      // accumulated body on every chunk, which hurts on large pages.
+      const chunks: Buffer[] = [];
+      res.on('data', chunk => chunks.push(Buffer.from(chunk)));
+      res.on('end', () => resolve(Buffer.concat(chunks).toString('utf8')));
       res.on('error', reject);
     });
     
@@ -239,40 +248,52 @@ function setCache(key: string, data: any) {
   webCache.set(key, { data, expires: Date.now() + CACHE_TTL_MS });
 }
 
+// Entity decoding used to be a chain of seven sequential replaces, each a
+// full scan of the text. A single alternation plus lookup table does the
+// same work in one pass.
+const HTML_ENTITY_RE = /&(?:nbsp|amp|lt|gt|quot|#39|apos);/g;
+const HTML_ENTITY_MAP: Record<string, string> = {
+  '&nbsp;': ' ',
+  '&amp;': '&',
+  '&lt;': '<',
+  '&gt;': '>',
+  '&quot;': '"',
+  '&#39;': "'",
+  '&apos;': "'"
+};
+
 function stripHtml(html: string): string {
-  // Remove script and style tags with content
-  let text = html.replace(/<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>/gi, ' ');
-  text = text.replace(/<style\b[^<]*(?:(?!<\/style>)<[^<]*)*<\/style>/gi, ' ');
-  
+  // Remove script and style tags with content in one alternation pass; the
+  // backreference keeps opening and closing tags paired, so this matches
+  // exactly what the previous two sequential regexes removed.
+  let text = html.replace(/<(script|style)\b[^<]*(?:(?!<\/\1>)<[^<]*)*<\/\1>/gi, ' ');
+
   // Remove HTML tags
   text = text.replace(/<[^>]+>/g, ' ');
-  
-  // Decode common HTML entities
-  text = text.replace(/&nbsp;/g, ' ');
-  text = text.replace(/&amp;/g, '&');
-  text = text.replace(/&lt;/g, '<');
-  text = text.replace(/&gt;/g, '>');
-  text = text.replace(/&quot;/g, '"');
-  text = text.replace(/&#39;/g, "'");
-  text = text.replace(/&apos;/g, "'");
-  
+
+  // Decode common HTML entities in one pass
+  text = text.replace(HTML_ENTITY_RE, m => HTML_ENTITY_MAP[m]);
+
   // Normalize whitespace
   text = text.replace(/\s+/g, ' ').trim();
-  
+
   return text;
 }
 
+// Main content area patterns, hoisted so each call reuses the same compiled
+// regexes instead of re-creating the list per page. match() with /g always
+// scans from the start, so sharing them across calls is safe.
+const MAIN_CONTENT_PATTERNS = [
+  /<article[^>]*>([\s\S]*?)<\/article>/gi,
+  /<main[^>]*>([\s\S]*?)<\/main>/gi,
+  /<div[^>]*class="[^"]*content[^"]*"[^>]*>([\s\S]*?)<\/div>/gi,
+  /<div[^>]*class="[^"]*article[^"]*"[^>]*>([\s\S]*?)<\/div>/gi,
+  /<div[^>]*class="[^"]*post[^"]*"[^>]*>([\s\S]*?)<\/div>/gi,
+];
+
 function extractMainContent(html: string): string {
   // Try to find main content areas
-  const mainPatterns = [
-    /<article[^>]*>([\s\S]*?)<\/article>/gi,
-    /<main[^>]*>([\s\S]*?)<\/main>/gi,
-    /<div[^>]*class="[^"]*content[^"]*"[^>]*>([\s\S]*?)<\/div>/gi,
-    /<div[^>]*class="[^"]*article[^"]*"[^>]*>([\s\S]*?)<\/div>/gi,
-    /<div[^>]*class="[^"]*post[^"]*"[^>]*>([\s\S]*?)<\/div>/gi,
-  ];
-  
-  for (const pattern of mainPatterns) {
+  for (const pattern of MAIN_CONTENT_PATTERNS) {
     const matches = html.match(pattern);
     if (matches && matches.length > 0) {
       // Return the longest match (likely the main content)
@@ -287,18 +308,28 @@ function extractMainContent(html: string): string {
 
 // ============= SEARCH HELPERS =============
 
-// Filter out unwanted domains
+// Filter out unwanted domains. The block list is static, so build it once
+// at module load rather than allocating a fresh array per candidate URL —
+// this runs for every link scraped out of a results page.
+const BLOCKED_DOMAINS = [
+  'wikipedia.org',
+  'duckduckgo.com',
+  'google.com/search',
+  'bing.com/search',
+  'brave.com',
+  'account.brave.com',
+  'search.brave.com'
+];
+
+// Compile the list into one alternation so each URL is scanned once instead
+// of once per blocked entry. Entries are escaped, so this matches exactly
+// the same substrings the includes() loop did.
+const BLOCKED_DOMAINS_RE = new RegExp(
+  BLOCKED_DOMAINS.map(d => d.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|')
+);
+
 function isAllowedDomain(url: string): boolean {
-  const blockedDomains = [
-    'wikipedia.org',
-    'duckduckgo.com',
-    'google.com/search',
-    'bing.com/search',
-    'brave.com',
-    'account.brave.com',
-    'search.brave.com'
-  ];
-  return !blockedDomains.some(domain => url.includes(domain));
+  return !BLOCKED_DOMAINS_RE.test(url);
 }
 
 // Search using Google (most reliable)
@@ -504,32 +535,39 @@ export const webSearchHandler: ToolHandler = async (args): Promise<ToolResult> =
     let topContent: { url: string; title: string; content: string } | null = null;
     
     if (fetchTop && results.length > 0) {
-      // Try to fetch the top result
-      for (let i = 0; i < Math.min(3, results.length); i++) {
+      // Fetch the top candidates concurrently instead of trying them one at
+      // a time; a slow or dead first result no longer delays the fallbacks.
+      // The best-ranked page with meaningful content still wins.
+      const candidates = results.slice(0, 3);
+      const pages = await Promise.all(candidates.map(async (r) => {
         try {
-          console.log(`[SADIE Web] Fetching content from: ${results[i].url}`);
-          const html = await httpGet(results[i].url);
-          
-          // Extract title
-          const titleMatch = html.match(/<title[^>]*>([^<]+)<\/title>/i);
-          const title = titleMatch ? stripHtml(titleMatch[1]).trim() : results[i].title;
-          
-          // Extract content
-          let content = extractMainContent(html);
-          
-          // Only use if we got meaningful content
-          if (content.length > 200) {
-            // Truncate to reasonable size
-            if (content.length > 3000) {
-              content = content.substring(0, 3000) + '... [truncated]';
-            }
-            topContent = { url: results[i].url, title, content };
-            console.log(`[SADIE Web] Got ${content.length} chars from ${results[i].url}`);
-            break;
-          }
+          console.log(`[SADIE Web] Fetching content from: ${r.url}`);
+          return { url: r.url, fallbackTitle: r.title, html: await httpGet(r.url) };
         } catch (err: any) {
-          console.log(`[SADIE Web] Failed to fetch ${results[i].url}: ${err.message}`);
-          continue;
+          console.log(`[SADIE Web] Failed to fetch ${r.url}: ${err.message}`);
+          return null;
+        }
+      }));
+
+      for (const page of pages) {
+        if (!page) continue;
+
+        // Extract title
+        const titleMatch = page.html.match(/<title[^>]*>([^<]+)<\/title>/i);
+        const title = titleMatch ? stripHtml(titleMatch[1]).trim() : page.fallbackTitle;
+
+        // Extract content
+        let content = extractMainContent(page.html);
+
+        // Only use if we got meaningful content
+        if (content.length > 200) {
+          // Truncate to reasonable size
+          if (content.length > 3000) {
+            content = content.substring(0, 3000) + '... [truncated]';
+          }
+          topContent = { url: page.url, title, content };
+          console.log(`[SADIE Web] Got ${content.length} chars from ${page.url}`);
+          break;
         }
       }
     }
@@ -12,55 +12,76 @@ function getLogDir(): string {
   }
 }
 
-function ensureLogDir() {
+// The log directory and startup log path never change within a process, so
+// compute and ensure them once instead of stat-ing the directory per line.
+let startupLogPath: string | null = null;
+
+function getStartupLogPath(): string {
+  if (startupLogPath) return startupLogPath;
+  const LOG_DIR = getLogDir();
   try {
-    const LOG_DIR = getLogDir();
     if (!fs.existsSync(LOG_DIR)) fs.mkdirSync(LOG_DIR, { recursive: true });
   } catch (err) {
     // ignore
   }
+  startupLogPath = path.join(LOG_DIR, 'startup.log');
+  return startupLogPath;
+}
+
+// Startup lines are buffered and flushed in one appendFileSync rather than
+// paying a synchronous write per message; errors still flush immediately so
+// they hit disk even if the process dies right after.
+const pendingLines: string[] = [];
+let flushTimer: NodeJS.Timeout | null = null;
+const FLUSH_DELAY_MS = 250;
+
+function flushStartupLog() {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  if (pendingLines.length === 0) return;
+  const batch = pendingLines.join('');
+  pendingLines.length = 0;
+  try {
+    fs.appendFileSync(getStartupLogPath(), batch);
+  } catch (err) {
+    console.error('Failed to write startup log:', err);
+  }
+}
+
+function queueLine(line: string) {
+  pendingLines.push(line);
+  if (!flushTimer) {
+    flushTimer = setTimeout(flushStartupLog, FLUSH_DELAY_MS);
+    if (typeof flushTimer.unref === 'function') flushTimer.unref();
+  }
 }
 
 export function initLogging() {
-  ensureLogDir();
   try {
-    const LOG_DIR = getLogDir();
-    const STARTUP_LOG = path.join(LOG_DIR, 'startup.log');
     const header = `\n--- SADIE Startup ${new Date().toISOString()} ---\n`;
-    fs.appendFileSync(STARTUP_LOG, header);
+    fs.appendFileSync(getStartupLogPath(), header);
   } catch (err) {
     console.error('Failed to initialize startup log:', err);
   }
+  // Make sure buffered lines land on disk when the process exits normally
+  process.on('exit', flushStartupLog);
 }
 
 export function logStartup(message: string) {
-  try {
-    ensureLogDir();
-    const LOG_DIR = getLogDir();
-    const STARTUP_LOG = path.join(LOG_DIR, 'startup.log');
-    const line = `${new Date().toISOString()} - ${message}\n`;
-    fs.appendFileSync(STARTUP_LOG, line);
-  } catch (err) {
-    console.error('Failed to write startup log:', err);
-  }
+  queueLine(`${new Date().toISOString()} - ${message}\n`);
 }
 
 export function logError(err: any) {
-  try {
-    ensureLogDir();
-    const LOG_DIR = getLogDir();
-    const STARTUP_LOG = path.join(LOG_DIR, 'startup.log');
-    const line = `${new Date().toISOString()} - ERROR: ${err && err.stack ? err.stack : String(err)}\n`;
-    fs.appendFileSync(STARTUP_LOG, line);
-  } catch (e) {
-    console.error('Failed to write error to startup log:', e);
-  }
+  const line = `${new Date().toISOString()} - ERROR: ${err && err.stack ? err.stack : String(err)}\n`;
+  pendingLines.push(line);
+  flushStartupLog();
 }
 
 export function logTelemetryConsent(action: 'consent_given' | 'consent_revoked', details: Record<string, any>) {
   try {
-    ensureLogDir();
-    const LOG_DIR = getLogDir();
+    const LOG_DIR = path.dirname(getStartupLogPath());
     const CON_SENT_LOG = path.join(LOG_DIR, 'telemetry-consent.log');
     const entry = {
       timestamp: new Date().toISOString(),
@@ -88,12 +88,14 @@ const App: React.FC<AppProps> = ({ initialMessages }) => {
     let mounted = true;
     (async () => {
       try {
-        // Load settings
-        const loaded = await window.electron.getSettings();
+        // Load settings and conversations concurrently — the two IPC round
+        // trips are independent, so hydration waits on the slower of the
+        // two instead of their sum.
+        const [loaded, convResult] = await Promise.all([
+          window.electron.getSettings(),
+          window.electron.loadConversations?.(),
+        ]);
         if (mounted && loaded) setSettings(prev => ({ ...prev, ...loaded }));
-        
-        // Load conversations from memory
-        const convResult = await window.electron.loadConversations?.();
         if (mounted && convResult?.success && convResult.data) {
           const store = convResult.data;
           
@@ -140,6 +142,21 @@ const App: React.FC<AppProps> = ({ initialMessages }) => {
     return () => { mounted = false; };
   }, [newId, initialMessages]);
 
+  // Probe backend status in the background on mount. The status bar starts
+  // at 'checking' and previously only resolved after the first send or a
+  // manual refresh; firing the check here (not awaited by the hydration
+  // effect) fills it in without delaying first paint.
+  useEffect(() => {
+    let mounted = true;
+    (async () => {
+      try {
+        const c = await window.electron.checkConnection?.();
+        if (mounted && c) setStatus(c);
+      } catch (e) { /* leave 'checking'; the refresh button retries */ }
+    })();
+    return () => { mounted = false; };
+  }, []);
+
   // show first-run onboarding modal if enabled
   const [firstRunOpen, setFirstRunOpen] = useState(false);
 
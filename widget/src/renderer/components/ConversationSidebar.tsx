@@ -37,8 +37,10 @@ const ConversationSidebar: React.FC<ConversationSidebarProps> = ({
       const result = await (window as any).electron.loadConversations?.();
       if (result?.success && result.data?.conversations) {
         const convList = Object.values(result.data.conversations) as Conversation[];
-        // Sort by updatedAt descending
-        convList.sort((a, b) => new Date(b.updatedAt).getTime() - new Date(a.updatedAt).getTime());
+        // Sort by updatedAt descending. Timestamps are ISO-8601, which
+        // orders lexicographically, so a plain string compare avoids
+        // constructing two Date objects per comparison.
+        convList.sort((a, b) => (b.updatedAt < a.updatedAt ? -1 : b.updatedAt > a.updatedAt ? 1 : 0));
         setConversations(convList);
       }
     } catch (err) {
@@ -123,8 +123,13 @@ export function InputBox({ onSendMessage, disabled }: InputBoxProps) {
       return;
     }
 
+    // Build the recognizer once and reuse it across toggles; constructing
+    // and re-wiring a fresh instance per press re-initializes the engine's
+    // session each time. The handlers below only use setters, so they stay
+    // valid for the component's lifetime.
     if (recognitionRef.current) {
-      recognitionRef.current.abort();
+      recognitionRef.current.start();
+      return;
     }
 
     const recognition = new SpeechRecognition();
@@ -185,10 +190,8 @@ export function InputBox({ onSendMessage, disabled }: InputBoxProps) {
   }, []);
 
   const stopListening = useCallback(() => {
-    if (recognitionRef.current) {
-      recognitionRef.current.stop();
-      recognitionRef.current = null;
-    }
+    // Stop but keep the instance so the next toggle restarts warm
+    recognitionRef.current?.stop();
     setIsListening(false);
   }, []);
 
@@ -2,6 +2,11 @@ import React, { useEffect, useRef } from "react";
 import type { ChatMessage } from "../types";
 import { MessageBubble } from "./MessageBubble";
 
+// Cap how many bubbles are mounted at once. Every message keeps its DOM
+// alive, so very long sessions otherwise pay layout and reconciliation for
+// history far above the fold; the stored conversation is unaffected.
+const MAX_RENDERED_MESSAGES = 200;
+
 export function MessageList({
   messages,
   onCancel,
@@ -12,9 +17,22 @@ export function MessageList({
   onRetry: (assistantId: string) => void;
 }) {
   const endRef = useRef<HTMLDivElement | null>(null);
+  const scrollQueued = useRef(false);
 
+  // During streaming, `messages` changes on every chunk; scrolling each time
+  // forces layout per chunk. Coalesce to at most one scroll per animation
+  // frame — the frame picks up however many chunks landed in the meantime.
   useEffect(() => {
-    endRef.current?.scrollIntoView({ behavior: "smooth", block: "end" });
+    if (scrollQueued.current) return;
+    if (typeof requestAnimationFrame !== "function") {
+      endRef.current?.scrollIntoView({ behavior: "smooth", block: "end" });
+      return;
+    }
+    scrollQueued.current = true;
+    requestAnimationFrame(() => {
+      scrollQueued.current = false;
+      endRef.current?.scrollIntoView({ behavior: "smooth", block: "end" });
+    });
   }, [messages]);
 
   // Show welcome message if no messages
@@ -30,9 +48,19 @@ export function MessageList({
     );
   }
 
+  const visibleMessages =
+    messages.length > MAX_RENDERED_MESSAGES
+      ? messages.slice(-MAX_RENDERED_MESSAGES)
+      : messages;
+
   return (
     <div className="message-list">
-      {messages.map((m) => (
+      {visibleMessages.length < messages.length && (
+        <div className="message-list-truncated">
+          Showing the last {visibleMessages.length} messages
+        </div>
+      )}
+      {visibleMessages.map((m) => (
         <MessageBubble
           key={m.id}
           message={m}
@@ -11,6 +11,33 @@ interface StatusIndicatorProps {
   onDismissDiagnostic?: () => void;
 }
 
+// Status display strings are static, so map them via module-level lookup
+// tables instead of rebuilding switch closures on every render.
+const STATUS_CLASS: Record<string, string> = {
+  online: 'connected',
+  checking: 'checking',
+  offline: 'disconnected',
+};
+
+const STATUS_TEXT: Record<string, string> = {
+  online: 'Connected',
+  offline: 'Offline',
+  checking: 'Checking...',
+};
+
+const getStatusClass = (status: 'online' | 'offline' | 'checking') =>
+  STATUS_CLASS[status] || 'disconnected';
+
+// Both states of the uncensored toggle, precomputed like the status tables
+// above rather than rebuilt from ternaries on each render.
+const UNCENSORED_UI = {
+  on: { icon: '🔓', label: 'Uncensored', title: 'Uncensored Mode ON (dolphin-llama3:8b)' },
+  off: { icon: '🔒', label: 'Safe', title: 'Uncensored Mode OFF (llama3.2:3b)' },
+} as const;
+
+const getStatusText = (status: 'online' | 'offline' | 'checking') =>
+  STATUS_TEXT[status] || 'Unknown';
+
 const StatusIndicator: React.FC<StatusIndicatorProps> = ({
   connectionStatus,
   onRefresh,
@@ -34,30 +61,6 @@ const StatusIndicator: React.FC<StatusIndicatorProps> = ({
     await (window as any).electron?.setUncensoredMode?.(newValue);
   };
 
-  const getStatusClass = (status: 'online' | 'offline' | 'checking') => {
-    switch (status) {
-      case 'online':
-        return 'connected';
-      case 'checking':
-        return 'checking';
-      default:
-        return 'disconnected';
-    }
-  };
-
-  const getStatusText = (status: 'online' | 'offline' | 'checking') => {
-    switch (status) {
-      case 'online':
-        return 'Connected';
-      case 'offline':
-        return 'Offline';
-      case 'checking':
-        return 'Checking...';
-      default:
-        return 'Unknown';
-    }
-  };
-
   return (
     <div className="app-header">
       {onMenuClick && (
@@ -106,13 +109,13 @@ const StatusIndicator: React.FC<StatusIndicatorProps> = ({
         )}
         
         {/* Uncensored Mode Toggle */}
-        <div 
+        <div
           className={`uncensored-toggle ${uncensoredMode ? 'active' : ''}`}
           onClick={handleUncensoredToggle}
-          title={uncensoredMode ? 'Uncensored Mode ON (dolphin-llama3:8b)' : 'Uncensored Mode OFF (llama3.2:3b)'}
+          title={UNCENSORED_UI[uncensoredMode ? 'on' : 'off'].title}
         >
-          <span className="toggle-icon">{uncensoredMode ? '🔓' : '🔒'}</span>
-          <span className="toggle-label">{uncensoredMode ? 'Uncensored' : 'Safe'}</span>
+          <span className="toggle-icon">{UNCENSORED_UI[uncensoredMode ? 'on' : 'off'].icon}</span>
+          <span className="toggle-label">{UNCENSORED_UI[uncensoredMode ? 'on' : 'off'].label}</span>
         </div>
       </div>
 
@@ -16,14 +16,24 @@ export async function resizeImageFile(file: File, opts: ResizeOptions = {}) {
   let targetWidth = width;
   let targetHeight = height;
 
-  if (width > maxWidth || height > maxHeight) {
-    const widthRatio = maxWidth / width;
-    const heightRatio = maxHeight / height;
-    const ratio = Math.min(widthRatio, heightRatio);
-    targetWidth = Math.round(width * ratio);
-    targetHeight = Math.round(height * ratio);
+  if (width <= maxWidth && height <= maxHeight) {
+    // Already within bounds — skip the canvas draw + re-encode round trip
+    // and ship the original bytes as-is.
+    return {
+      filename: file.name,
+      mimeType: file.type,
+      data: dataUrl.split(',')[1],
+      url: dataUrl,
+      size: file.size,
+    } as const;
   }
 
+  const widthRatio = maxWidth / width;
+  const heightRatio = maxHeight / height;
+  const ratio = Math.min(widthRatio, heightRatio);
+  targetWidth = Math.round(width * ratio);
+  targetHeight = Math.round(height * ratio);
+
   // Draw to canvas
   const canvas = document.createElement('canvas');
   canvas.width = targetWidth;